@@ -3,7 +3,8 @@ Advent of Code - Day 01
 https://adventofcode.com/2025/day/1
 """
 
-from common import read_input, read_lines
+from common import read_input, read_lines, iter_lines
+from typing import Iterable
 from pathlib import Path
 import sys
 import re
@@ -23,7 +24,7 @@ def rotate_dial(dial: Dial, turn: str, steps: int) -> None:
         case "R":
             dial.rotate(Rotation.RIGHT, steps)
 
-def part1(instructions: list[str]) -> int:
+def part1(instructions: Iterable[str]) -> int:
     """Solve part 1 of the puzzle."""
 
     dial = Dial(pointer=50)
@@ -34,7 +35,7 @@ def part1(instructions: list[str]) -> int:
     return dial.zero_endings
 
 
-def part2(instructions: list[str]) -> int:
+def part2(instructions: Iterable[str]) -> int:
     """Solve part 2 of the puzzle."""
     dial = Dial(pointer=50)
     for instruction in instructions:
@@ -47,11 +48,10 @@ def part2(instructions: list[str]) -> int:
 def main():
     # Read input
     input_file = Path(__file__).parent / "input.txt"
-    data = read_lines(str(input_file))
 
-    # Solve and print results
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    # Solve and print results, streaming the instructions for each part
+    print(f"Part 1: {part1(iter_lines(str(input_file)))}")
+    print(f"Part 2: {part2(iter_lines(str(input_file)))}")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ Test cases for Day 01
 """
 
 from solution import part1, part2
+import io
 import pytest
 from pathlib import Path
 import sys
@@ -10,22 +11,33 @@ import sys
 # Add parent directory to path to import solution
 sys.path.append(str(Path(__file__).parent))
 
+from common import iter_lines
+
 
 EXAMPLE_INPUT = """
-# TODO: Add example input from problem description
+L68
+L30
+R48
+L5
+R60
+L55
+L1
+L99
+R14
+L82
 """
 
 
 def test_part1_example():
     """Test part 1 with example input."""
-    result = part1(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part1(iter_lines(io.StringIO(EXAMPLE_INPUT.strip())))
+    assert result == 3
 
 
 def test_part2_example():
     """Test part 2 with example input."""
-    result = part2(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part2(iter_lines(io.StringIO(EXAMPLE_INPUT.strip())))
+    assert result == 6
 
 
 if __name__ == "__main__":
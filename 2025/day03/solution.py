@@ -3,7 +3,8 @@ Advent of Code - Day 03
 https://adventofcode.com/2025/day/3
 """
 
-from common import read_input, read_lines
+from common import read_input, read_lines, iter_lines
+from typing import Iterable
 from pathlib import Path
 from itertools import combinations
 import sys
@@ -43,13 +44,13 @@ class BatteryBank:
         return idx
 
 
-def part1(batteries: list[BatteryBank]) -> int:
+def part1(batteries: Iterable[BatteryBank]) -> int:
     """Solve part 1 of the puzzle."""
     # TODO: Implement solution
     return sum(b.get_largest_joltage_possible(2) for b in batteries)
 
 
-def part2(batteries: list[BatteryBank]) -> int:
+def part2(batteries: Iterable[BatteryBank]) -> int:
     """Solve part 2 of the puzzle."""
     # TODO: Implement solution
     return sum(b.get_largest_joltage_possible(12) for b in batteries)
@@ -58,13 +59,10 @@ def part2(batteries: list[BatteryBank]) -> int:
 def main():
     # Read input
     input_file = Path(__file__).parent / "input.txt"
-    data = read_lines(str(input_file))
-    
-    data = list(map(lambda e: BatteryBank(e), data))
 
-    # Solve and print results
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    # Solve and print results, streaming the banks for each part
+    print(f"Part 1: {part1(map(BatteryBank, iter_lines(str(input_file))))}")
+    print(f"Part 2: {part2(map(BatteryBank, iter_lines(str(input_file))))}")
 
 
 if __name__ == "__main__":
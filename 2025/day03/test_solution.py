@@ -2,7 +2,8 @@
 Test cases for Day 03
 """
 
-from solution import part1, part2
+from solution import part1, part2, BatteryBank
+import io
 import pytest
 from pathlib import Path
 import sys
@@ -10,22 +11,27 @@ import sys
 # Add parent directory to path to import solution
 sys.path.append(str(Path(__file__).parent))
 
+from common import iter_lines
+
 
 EXAMPLE_INPUT = """
-# TODO: Add example input from problem description
+987654321111111
+811111111111119
+234234234234278
+818181911112111
 """
 
 
 def test_part1_example():
     """Test part 1 with example input."""
-    result = part1(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part1(map(BatteryBank, iter_lines(io.StringIO(EXAMPLE_INPUT.strip()))))
+    assert result == 357
 
 
 def test_part2_example():
     """Test part 2 with example input."""
-    result = part2(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part2(map(BatteryBank, iter_lines(io.StringIO(EXAMPLE_INPUT.strip()))))
+    assert result == 3121910778619
 
 
 if __name__ == "__main__":
@@ -10,22 +10,37 @@ import sys
 # Add parent directory to path to import solution
 sys.path.append(str(Path(__file__).parent))
 
+from common import CompactGrid
+
 
 EXAMPLE_INPUT = """
-# TODO: Add example input from problem description
+..@@.@@@@.
+@@@.@.@.@@
+@@@@@.@.@@
+@.@@@@..@.
+@@.@@@@.@@
+.@@@@@@@.@
+.@.@.@.@@@
+@.@@@.@@@@
+.@@@@@@@@.
+@.@.@@@.@.
 """
 
 
+def example_grid() -> CompactGrid:
+    return CompactGrid.from_rows(EXAMPLE_INPUT.strip().splitlines())
+
+
 def test_part1_example():
     """Test part 1 with example input."""
-    result = part1(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part1(example_grid())
+    assert result == 13
 
 
 def test_part2_example():
     """Test part 2 with example input."""
-    result = part2(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part2(example_grid())
+    assert result == 43
 
 
 if __name__ == "__main__":
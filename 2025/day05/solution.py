@@ -3,7 +3,9 @@ Advent of Code - Day 05
 https://adventofcode.com/2025/day/5
 """
 
-from common import read_input, read_lines, Range
+from common import read_input, read_lines, iter_lines, Range
+from itertools import takewhile
+from typing import Iterable
 from pathlib import Path
 from py_linq.py_linq import Enumerable
 import sys
@@ -15,9 +17,9 @@ def is_ingredient_fresh(ranges: list[Range], ingredient: int) -> bool:
     return Enumerable(ranges).any(lambda x: ingredient in x)
 
 
-def part1(ranges: list[Range], ingredients: list[str]) -> int:
+def part1(ranges: list[Range], ingredients: Iterable[str]) -> int:
     """Solve part 1 of the puzzle."""
-    return Enumerable(ingredients).where(lambda x: is_ingredient_fresh(ranges, int(x))).count()
+    return sum(1 for x in ingredients if is_ingredient_fresh(ranges, int(x)))
     
 
 
@@ -50,10 +52,10 @@ def part2(ranges: list[Range]) -> int:
 def main():
     # Read input
     input_file = Path(__file__).parent / "input.txt"
-    data = read_lines(str(input_file))
-    idx = data.index('')
-    ranges, ingredients = data[:idx], data[idx+1:]
-    ranges = [Range(*map(int, r.split('-'))) for r in ranges]
+    # Ranges come first; the ingredients after the blank line are streamed
+    lines = iter_lines(str(input_file))
+    ranges = [Range(*map(int, r.split('-'))) for r in takewhile(bool, lines)]
+    ingredients = lines
 
     # Solve and print results
     print(f"Part 1: {part1(ranges, ingredients)}")
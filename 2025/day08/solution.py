@@ -3,12 +3,11 @@ Advent of Code - Day 08
 https://adventofcode.com/2025/day/8
 """
 
-from common import read_input, read_lines, UnionFind
+from common import read_input, read_lines, closest_pairs, kruskal
 from pathlib import Path
 from math import sqrt
 from functools import total_ordering
 from dataclasses import dataclass
-from itertools import combinations
 from py_linq.py_linq import Enumerable
 
 import sys
@@ -43,32 +42,22 @@ def part1(data: list[str], pairs: int) -> int:
     """Solve part 1 of the puzzle."""
     
     boxes = Enumerable(data).select(lambda x: Box(*x.split(','))).to_list()
-    combs = sorted(combinations(boxes, 2), key=lambda x: x[0].distance(x[1]))
-    disjoint_set = UnionFind(items=boxes)
+    points = [(box.x, box.y, box.z) for box in boxes]
+    circuits = kruskal(len(boxes), closest_pairs(points), max_attempted=pairs,
+                       stop_when_connected=False)
     
-    i = 0
-    for box1, box2 in combs:
-        disjoint_set.union(box1, box2)
-        i += 1
-        if i == pairs: break
-    
-    circuits = sorted(disjoint_set.get_component_sizes(),reverse=True)
-    
-    return Enumerable(circuits).take(3).aggregate(lambda x, y: x * y)
+    return Enumerable(circuits.union_find.top_sizes(3)).aggregate(lambda x, y: x * y)
 
 
 def part2(data: list[str]) -> int:
     boxes = Enumerable(data).select(lambda x: Box(*x.split(','))).to_list()
-    combs = sorted(combinations(boxes, 2), key=lambda x: x[0].distance(x[1]))
-    disjoint_set = UnionFind(items=boxes)
+    points = [(box.x, box.y, box.z) for box in boxes]
+    circuits = kruskal(len(boxes), closest_pairs(points))
     
-    for box1, box2 in combs:
-        disjoint_set.union(box1, box2)
-        
-        circuits = sorted(disjoint_set.get_component_sizes(),reverse=True)
-        if circuits[0] == len(boxes): 
-            return box1.x * box2.x # One giant circuit
-    return 0
+    if not circuits.connected:
+        return 0
+    _, i, j = circuits.last_edge # Joined everything into one giant circuit
+    return boxes[i].x * boxes[j].x
 
 
 
@@ -12,20 +12,39 @@ sys.path.append(str(Path(__file__).parent))
 
 
 EXAMPLE_INPUT = """
-# TODO: Add example input from problem description
+162,817,812
+57,618,57
+906,360,560
+592,479,940
+352,342,300
+466,668,158
+542,29,236
+431,825,988
+739,650,466
+52,470,668
+216,146,977
+819,987,18
+117,168,530
+805,96,715
+346,949,466
+970,615,88
+941,993,340
+862,61,35
+984,92,344
+425,690,689
 """
 
 
 def test_part1_example():
     """Test part 1 with example input."""
-    result = part1(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part1(EXAMPLE_INPUT.strip().splitlines(), 10)
+    assert result == 40
 
 
 def test_part2_example():
     """Test part 2 with example input."""
-    result = part2(EXAMPLE_INPUT.strip())
-    assert result == None  # TODO: Add expected result
+    result = part2(EXAMPLE_INPUT.strip().splitlines())
+    assert result == 25272
 
 
 if __name__ == "__main__":
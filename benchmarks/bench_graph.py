@@ -0,0 +1,63 @@
+"""
+Benchmark: repeated searches through neighbors_fn against the CSR Graph.
+
+Builds a weighted grid graph once, then runs the same Dijkstra and BFS
+queries with the closure-based searches and with the Graph methods, and
+checks that they agree.
+
+Usage:
+    python benchmarks/bench_graph.py
+"""
+
+from pathlib import Path
+from time import perf_counter
+import random
+import sys
+
+# Add common utilities to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common import bfs, dijkstra
+from common.graph import Graph
+
+SIDE = 300
+QUERIES = 5
+
+
+def neighbors(point):
+    x, y = point
+    return [(nx, ny) for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+            if 0 <= nx < SIDE and 0 <= ny < SIDE]
+
+
+def main():
+    rng = random.Random(1)
+    costs = {(x, y): rng.randint(1, 9) for y in range(SIDE) for x in range(SIDE)}
+
+    def weighted(point):
+        return [(neighbor, costs[neighbor]) for neighbor in neighbors(point)]
+
+    starts = [(rng.randrange(SIDE), rng.randrange(SIDE)) for _ in range(QUERIES)]
+
+    t0 = perf_counter()
+    graph = Graph.from_neighbors([starts[0]], weighted, weighted=True)
+    t1 = perf_counter()
+    print(f"{len(graph)} nodes, {graph.edge_count} edges, built in {t1 - t0:.3f} s")
+
+    for name, generic, csr in (
+        ('dijkstra', lambda start: dijkstra(start, weighted), graph.dijkstra),
+        ('bfs', lambda start: bfs(start, neighbors), graph.bfs),
+    ):
+        t0 = perf_counter()
+        expected = [generic(start) for start in starts]
+        t1 = perf_counter()
+        actual = [csr(start) for start in starts]
+        t2 = perf_counter()
+
+        assert actual == expected
+        print(f"{name:10} x{QUERIES}  neighbors_fn {t1 - t0:7.3f} s  Graph {t2 - t1:7.3f} s"
+              f"  ({(t1 - t0) / (t2 - t1):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: generic bfs() against the flat-index grid_bfs().
+
+Runs both searches on a random open map and a random maze-like map and
+checks that they agree.
+
+Usage:
+    python benchmarks/bench_grid_bfs.py
+"""
+
+from pathlib import Path
+from time import perf_counter
+import random
+import sys
+
+# Add common utilities to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common import CompactGrid, Point, bfs
+from common.algorithms import grid_bfs
+
+
+def random_grid(size: int, wall_ratio: float, seed: int) -> CompactGrid:
+    rng = random.Random(seed)
+    rows = [
+        ''.join('#' if rng.random() < wall_ratio else '.' for _ in range(size))
+        for _ in range(size)
+    ]
+    grid = CompactGrid.from_rows(rows)
+    grid.set(Point(0, 0), '.')
+    return grid
+
+
+def run(name: str, grid: CompactGrid):
+    start = Point(0, 0)
+
+    def neighbors(point):
+        return [n for n in grid.neighbors(point) if grid.get(n) != '#']
+
+    t0 = perf_counter()
+    generic = bfs(start, neighbors)
+    t1 = perf_counter()
+    flat = grid_bfs(grid, start, lambda cell: cell != '#')
+    t2 = perf_counter()
+
+    assert flat.to_dict() == generic
+    print(f"{name:10} reached {len(generic):8}  bfs {t1 - t0:7.3f} s  grid_bfs {t2 - t1:7.3f} s"
+          f"  ({(t1 - t0) / (t2 - t1):.1f}x)")
+
+
+def main():
+    run('open', random_grid(700, 0.1, 1))
+    run('maze-like', random_grid(700, 0.35, 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: a_star() against jump_point_search() on 4-connected grids.
+
+Runs corner-to-corner queries on an open map, a random obstacle map and
+a maze, and checks that both searches find paths of the same cost.
+
+Usage:
+    python benchmarks/bench_jps.py
+"""
+
+from pathlib import Path
+import random
+import sys
+
+# Add common utilities to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common import CompactGrid, Point, SearchStats, a_star
+from common.algorithms import jump_point_search
+
+
+def random_grid(size: int, wall_ratio: float, seed: int) -> CompactGrid:
+    rng = random.Random(seed)
+    rows = [
+        ''.join('#' if rng.random() < wall_ratio else '.' for _ in range(size))
+        for _ in range(size)
+    ]
+    grid = CompactGrid.from_rows(rows)
+    grid.set(Point(0, 0), '.')
+    grid.set(Point(size - 1, size - 1), '.')
+    return grid
+
+
+def maze_grid(size: int, seed: int) -> CompactGrid:
+    """Perfect maze carved by a randomized DFS between even coordinates."""
+    rng = random.Random(seed)
+    grid = CompactGrid(size, size, fill='#')
+    cells = size // 2
+    stack = [(0, 0)]
+    seen = {(0, 0)}
+    grid.set(Point(0, 0), '.')
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                   if 0 <= x + dx < cells and 0 <= y + dy < cells and (x + dx, y + dy) not in seen]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        seen.add((nx, ny))
+        grid.set(Point(x + nx, y + ny), '.')
+        grid.set(Point(2 * nx, 2 * ny), '.')
+        stack.append((nx, ny))
+    return grid
+
+
+def run(name: str, grid: CompactGrid, start: Point, goal: Point):
+    def neighbors(point):
+        return [(n, 1) for n in grid.neighbors(point) if grid.get(n) != '#']
+
+    slow, fast = SearchStats(), SearchStats()
+    _, expected = a_star(start, goal, neighbors, Point.manhattan_distance, stats=slow)
+    _, actual = jump_point_search(grid, start, goal, lambda cell: cell != '#', stats=fast)
+
+    assert actual == expected
+    print(f"{name:10} cost {expected:6}  a_star {slow.elapsed:7.3f} s ({slow.expanded:7} expanded)"
+          f"  jps {fast.elapsed:7.3f} s ({fast.expanded:6} expanded)"
+          f"  ({slow.elapsed / fast.elapsed:.1f}x)")
+
+
+def main():
+    size = 401
+    corner, far = Point(0, 0), Point(size - 1, size - 1)
+    run('open', random_grid(size, 0.0, 1), corner, far)
+    run('obstacles', random_grid(size, 0.2, 2), corner, far)
+    maze = maze_grid(size, 3)
+    run('maze', maze, corner, Point(size - 3, size - 3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Microbenchmark: Point construction, hashing and memory.
+
+Compares the previous frozen-dataclass Point against the tuple-based
+Point and packed int coordinates.
+
+Usage:
+    python benchmarks/bench_point.py
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from timeit import timeit
+import sys
+import tracemalloc
+
+# Add common utilities to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.grid import Point, pack_point
+
+
+@dataclass(frozen=True)
+class DataclassPoint:
+    """The frozen dataclass Point used before the tuple-based one."""
+    x: int
+    y: int
+
+
+SIDE = 300
+COORDS = [(x, y) for y in range(SIDE) for x in range(SIDE)]
+
+
+def build(factory):
+    return [factory(x, y) for x, y in COORDS]
+
+
+def measure_memory(factory) -> int:
+    tracemalloc.start()
+    items = build(factory)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main():
+    candidates = {
+        'dataclass Point': DataclassPoint,
+        'tuple Point': Point,
+        'packed int': pack_point,
+    }
+    print(f"{len(COORDS)} points")
+    print(f"{'':16} {'create (s)':>11} {'set build (s)':>14} {'memory (KB)':>12}")
+    for name, factory in candidates.items():
+        points = build(factory)
+        create = timeit(lambda: build(factory), number=5) / 5
+        hashing = timeit(lambda: set(points), number=5) / 5
+        memory = measure_memory(factory) / 1024
+        print(f"{name:16} {create:11.4f} {hashing:14.4f} {memory:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
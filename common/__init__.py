@@ -1,12 +1,28 @@
 """Common utilities for Advent of Code challenges."""
 
-from .file_utils import read_input, read_lines, read_integers, read_grid, read_columns
-from .grid import Grid, Point, Direction
+from .file_utils import (
+    read_input, read_lines, read_integers, read_grid, read_columns,
+    read_bytes, read_grid_mmap, MappedInput, iter_lines, iter_parsed, iter_sections
+)
+from .grid import Grid, CompactGrid, BitGrid, SparseGrid, Point, Direction, pack_point, unpack_point
 from .dial import Dial, Rotation
-from .algorithms import bfs, dfs, dijkstra
+from .algorithms import (
+    bfs, dfs, dijkstra, a_star, ShortestPaths, SearchStats, timed,
+    dfs_visit, strongly_connected_components, find_cycle, topological_sort,
+    iter_bfs, iter_dfs, iter_dijkstra, IncrementalSearch,
+    bidirectional_bfs, bidirectional_dijkstra, grid_bfs, GridDistances,
+    jump_point_search
+)
+from .graph import Graph
 from .range import Range
 from .trees import TernaryTree, TernaryNode
-from .union_find import UnionFind
+from .union_find import UnionFind, DenseUnionFind
+from .pairs import closest_pairs, squared_distance
+from .spatial import KDTree, BucketGrid, candidate_edges
+from .mst import kruskal, boruvka, MSTResult
+from .peeling import peel, peel_grid, PeelResult
+from .heaps import PriorityQueue, HeapQueue, BucketQueue, RadixHeap, IndexedHeap
+from .memo import BoundedCache, CacheStats, memoize, solve, StatePacker
 
 __all__ = [
     'read_input',
@@ -14,16 +30,67 @@ __all__ = [
     'read_integers',
     'read_grid',
     'read_columns',
+    'read_bytes',
+    'read_grid_mmap',
+    'MappedInput',
+    'iter_lines',
+    'iter_parsed',
+    'iter_sections',
     'Grid',
+    'CompactGrid',
+    'BitGrid',
+    'SparseGrid',
     'Dial',
     'Rotation',
     'Point',
     'Direction',
+    'pack_point',
+    'unpack_point',
     'Range',
     'bfs',
     'dfs',
     'dijkstra',
+    'a_star',
+    'ShortestPaths',
+    'SearchStats',
+    'timed',
+    'dfs_visit',
+    'strongly_connected_components',
+    'find_cycle',
+    'topological_sort',
+    'iter_bfs',
+    'iter_dfs',
+    'iter_dijkstra',
+    'IncrementalSearch',
+    'bidirectional_bfs',
+    'bidirectional_dijkstra',
+    'grid_bfs',
+    'GridDistances',
+    'jump_point_search',
+    'Graph',
     'TernaryTree',
     'TernaryNode',
-    'UnionFind'
+    'UnionFind',
+    'DenseUnionFind',
+    'closest_pairs',
+    'squared_distance',
+    'KDTree',
+    'BucketGrid',
+    'candidate_edges',
+    'kruskal',
+    'boruvka',
+    'MSTResult',
+    'peel',
+    'peel_grid',
+    'PeelResult',
+    'PriorityQueue',
+    'HeapQueue',
+    'BucketQueue',
+    'RadixHeap',
+    'IndexedHeap',
+    'BoundedCache',
+    'CacheStats',
+    'memoize',
+    'solve',
+    'StatePacker'
 ]
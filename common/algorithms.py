@@ -1,16 +1,189 @@
 """Common algorithms for graph traversal and pathfinding."""
 
+import json
+from array import array
 from collections import deque
+from dataclasses import asdict, dataclass
+from functools import wraps
 from heapq import heappush, heappop
-from typing import Callable, Dict, List, Set, Tuple, TypeVar, Optional, Hashable
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable, Dict, Generic, List, Set, Tuple, TypeVar, Optional, Hashable, Iterable, Iterator, Union
+
+from .grid import Grid, CompactGrid, Point, ORTHOGONAL_OFFSETS, DIAGONAL_OFFSETS
+from .heaps import PriorityQueue, HeapQueue
 
 T = TypeVar('T', bound=Hashable)
 
 
+@dataclass
+class SearchStats:
+    """
+    Opt-in counters for the searches in this module.
+
+    Pass an instance as stats= to any search that accepts it (the
+    traversal helpers dfs_visit() and friends do not); when it is left
+    out the searches skip all bookkeeping. One instance may be reused across calls
+    to accumulate totals.
+    """
+    expanded: int = 0  # nodes whose neighbors were generated
+    pushes: int = 0  # frontier insertions, including the start
+    stale_pops: int = 0  # pops skipped because the node was already settled
+    peak_frontier: int = 0  # largest frontier size seen
+    heuristic_calls: int = 0
+    elapsed: float = 0.0  # seconds spent inside (non-generator) searches
+
+    def seed(self, count: int) -> None:
+        """Count the pushes of the starting frontier and track the frontier peak."""
+        self.pushes += count
+        if count > self.peak_frontier:
+            self.peak_frontier = count
+
+    def expand(self, frontier_size: int) -> None:
+        """Count one expansion; frontier_size is taken after its neighbors are pushed."""
+        self.expanded += 1
+        if frontier_size > self.peak_frontier:
+            self.peak_frontier = frontier_size
+
+    def counting(self, heuristic_fn: Callable[[T, T], int]) -> Callable[[T, T], int]:
+        """Wrap a heuristic so its calls are counted."""
+        def counted(node: T, goal: T) -> int:
+            self.heuristic_calls += 1
+            return heuristic_fn(node, goal)
+        return counted
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        for name, value in asdict(SearchStats()).items():
+            setattr(self, name, value)
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """Counters as a plain dictionary."""
+        return asdict(self)
+
+    def to_json(self, **kwargs) -> str:
+        """Counters as a JSON object; kwargs are passed to json.dumps."""
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (
+            f"expanded={self.expanded} pushes={self.pushes} stale_pops={self.stale_pops} "
+            f"peak_frontier={self.peak_frontier} heuristic_calls={self.heuristic_calls} "
+            f"elapsed={self.elapsed:.4f}s"
+        )
+
+
+def timed(search: Callable) -> Callable:
+    """Add the wall time of a search to its stats= argument, when given."""
+    @wraps(search)
+    def wrapper(*args, **kwargs):
+        stats = kwargs.get('stats')
+        if stats is None:
+            return search(*args, **kwargs)
+        started = perf_counter()
+        try:
+            return search(*args, **kwargs)
+        finally:
+            stats.elapsed += perf_counter() - started
+    return wrapper
+
+
+class ShortestPaths(Dict[T, int]):
+    """
+    Distances returned by bfs()/dijkstra() when parents are tracked.
+
+    Behaves like the plain distance dictionary, and also keeps each node's
+    predecessor. With all_parents, every predecessor on a shortest path is
+    kept: a node with one parent stores it directly and only nodes with
+    several get a list, so the usual case costs one dict entry per node.
+    Path counts assume positive edge costs.
+    """
+
+    def __init__(self, start: T, all_parents: bool = False):
+        super().__init__()
+        self.start = start
+        self.all_parents = all_parents
+        self.parents: Dict[T, Any] = {}
+
+    def _set_parent(self, node: T, parent: T) -> None:
+        self.parents[node] = parent
+
+    def _add_parent(self, node: T, parent: T) -> None:
+        existing = self.parents[node]
+        if isinstance(existing, list):
+            existing.append(parent)
+        else:
+            self.parents[node] = [existing, parent]
+
+    def parents_of(self, node: T) -> List[T]:
+        """Recorded predecessors of node (empty for the start node)."""
+        parent = self.parents.get(node, self.parents)
+        if parent is self.parents:
+            return []
+        return parent[:] if isinstance(parent, list) else [parent]
+
+    def path_to(self, node: T) -> Optional[List[T]]:
+        """One shortest path from start to node, or None if node was not reached."""
+        if node not in self:
+            return None
+        path = [node]
+        while node in self.parents:
+            parent = self.parents[node]
+            node = parent[0] if isinstance(parent, list) else parent
+            path.append(node)
+        path.reverse()
+        return path
+
+    def count_shortest_paths(self, node: T) -> int:
+        """Number of distinct shortest paths from start to node (needs all_parents)."""
+        if not self.all_parents:
+            raise ValueError("path counts need the search to run with all_parents=True")
+        if node not in self:
+            return 0
+
+        counts = {self.start: 1}
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in counts:
+                stack.pop()
+                continue
+            parents = self.parents_of(current)
+            pending = [parent for parent in parents if parent not in counts]
+            if pending:
+                stack.extend(pending)
+            else:
+                counts[current] = sum(counts[parent] for parent in parents)
+                stack.pop()
+        return counts[node]
+
+    def all_shortest_path_nodes(self, node: T) -> Set[T]:
+        """Every node lying on some shortest path from start to node (needs all_parents)."""
+        if not self.all_parents:
+            raise ValueError("shortest path nodes need the search to run with all_parents=True")
+        if node not in self:
+            return set()
+
+        seen = {node}
+        stack = [node]
+        while stack:
+            for parent in self.parents_of(stack.pop()):
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.append(parent)
+        return seen
+
+
+@timed
 def bfs(
     start: T,
     neighbors_fn: Callable[[T], List[T]],
-    goal_fn: Optional[Callable[[T], bool]] = None
+    goal_fn: Optional[Callable[[T], bool]] = None,
+    parents: bool = False,
+    all_parents: bool = False,
+    *,
+    stats: Optional[SearchStats] = None
 ) -> Dict[T, int]:
     """
     Breadth-first search.
@@ -19,12 +192,19 @@ def bfs(
         start: Starting node
         neighbors_fn: Function that returns neighbors of a node
         goal_fn: Optional function to check if we've reached the goal
+        parents: Record a predecessor per node and return a ShortestPaths
+        all_parents: Record every shortest-path predecessor (implies parents)
+        stats: Optional SearchStats to fill
 
     Returns:
         Dictionary mapping nodes to their distance from start
     """
     queue = deque([start])
-    distances = {start: 0}
+    distances = ShortestPaths(start, all_parents) if parents or all_parents else {}
+    distances[start] = 0
+    paths = distances if isinstance(distances, ShortestPaths) else None
+    if stats is not None:
+        stats.seed(1)
 
     while queue:
         current = queue.popleft()
@@ -36,14 +216,25 @@ def bfs(
             if neighbor not in distances:
                 distances[neighbor] = distances[current] + 1
                 queue.append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+                if paths is not None:
+                    paths._set_parent(neighbor, current)
+            elif all_parents and distances[neighbor] == distances[current] + 1:
+                paths._add_parent(neighbor, current)
+        if stats is not None:
+            stats.expand(len(queue))
 
     return distances
 
 
+@timed
 def dfs(
     start: T,
     neighbors_fn: Callable[[T], List[T]],
-    goal_fn: Optional[Callable[[T], bool]] = None
+    goal_fn: Optional[Callable[[T], bool]] = None,
+    *,
+    stats: Optional[SearchStats] = None
 ) -> Set[T]:
     """
     Depth-first search.
@@ -52,17 +243,22 @@ def dfs(
         start: Starting node
         neighbors_fn: Function that returns neighbors of a node
         goal_fn: Optional function to check if we've reached the goal
+        stats: Optional SearchStats to fill
 
     Returns:
         Set of all visited nodes
     """
     stack = [start]
     visited = set()
+    if stats is not None:
+        stats.seed(1)
 
     while stack:
         current = stack.pop()
 
         if current in visited:
+            if stats is not None:
+                stats.stale_pops += 1
             continue
 
         visited.add(current)
@@ -70,17 +266,27 @@ def dfs(
         if goal_fn and goal_fn(current):
             return visited
 
+        size = len(stack)
         for neighbor in neighbors_fn(current):
             if neighbor not in visited:
                 stack.append(neighbor)
+        if stats is not None:
+            stats.pushes += len(stack) - size
+            stats.expand(len(stack))
 
     return visited
 
 
+@timed
 def dijkstra(
     start: T,
     neighbors_fn: Callable[[T], List[Tuple[T, int]]],
-    goal_fn: Optional[Callable[[T], bool]] = None
+    goal_fn: Optional[Callable[[T], bool]] = None,
+    queue: Callable[[], PriorityQueue] = HeapQueue,
+    parents: bool = False,
+    all_parents: bool = False,
+    *,
+    stats: Optional[SearchStats] = None
 ) -> Dict[T, int]:
     """
     Dijkstra's shortest path algorithm.
@@ -89,37 +295,67 @@ def dijkstra(
         start: Starting node
         neighbors_fn: Function that returns (neighbor, cost) tuples
         goal_fn: Optional function to check if we've reached the goal
+        queue: Priority queue class; BucketQueue or RadixHeap give near-linear
+            time for small non-negative integer costs, IndexedHeap keeps one
+            entry per node through decrease_key
+        parents: Record a predecessor per node and return a ShortestPaths
+        all_parents: Record every shortest-path predecessor (implies parents)
+        stats: Optional SearchStats to fill
 
     Returns:
         Dictionary mapping nodes to their shortest distance from start
     """
-    heap = [(0, start)]
-    distances = {start: 0}
+    frontier = queue()
+    frontier.push(0, start)
+    decrease_key = getattr(frontier, 'decrease_key', None)
+    distances = ShortestPaths(start, all_parents) if parents or all_parents else {}
+    distances[start] = 0
+    paths = distances if isinstance(distances, ShortestPaths) else None
+    if stats is not None:
+        stats.seed(1)
 
-    while heap:
-        current_dist, current = heappop(heap)
+    while frontier:
+        current_dist, current = frontier.pop()
 
         if goal_fn and goal_fn(current):
             return distances
 
         if current_dist > distances.get(current, float('inf')):
+            if stats is not None:
+                stats.stale_pops += 1
             continue
 
         for neighbor, cost in neighbors_fn(current):
             new_dist = current_dist + cost
+            old_dist = distances.get(neighbor, float('inf'))
 
-            if new_dist < distances.get(neighbor, float('inf')):
+            if new_dist < old_dist:
                 distances[neighbor] = new_dist
-                heappush(heap, (new_dist, neighbor))
+                if decrease_key is not None and neighbor in frontier:
+                    decrease_key(new_dist, neighbor)
+                else:
+                    frontier.push(new_dist, neighbor)
+                    if stats is not None:
+                        stats.pushes += 1
+                if paths is not None:
+                    paths._set_parent(neighbor, current)
+            elif all_parents and new_dist == old_dist and cost > 0:
+                paths._add_parent(neighbor, current)
+        if stats is not None:
+            stats.expand(len(frontier))
 
     return distances
 
 
+@timed
 def a_star(
     start: T,
     goal: T,
     neighbors_fn: Callable[[T], List[Tuple[T, int]]],
-    heuristic_fn: Callable[[T, T], int]
+    heuristic_fn: Callable[[T, T], int],
+    queue: Callable[[], PriorityQueue] = HeapQueue,
+    *,
+    stats: Optional[SearchStats] = None
 ) -> Tuple[Optional[List[T]], int]:
     """
     A* pathfinding algorithm.
@@ -129,17 +365,31 @@ def a_star(
         goal: Goal node
         neighbors_fn: Function that returns (neighbor, cost) tuples
         heuristic_fn: Heuristic function estimating cost from node to goal
+        queue: Priority queue class; the monotone BucketQueue and RadixHeap
+            require integer costs and a consistent heuristic, IndexedHeap
+            keeps one entry per node through decrease_key
+        stats: Optional SearchStats to fill
 
     Returns:
         Tuple of (path from start to goal, total cost), or (None, inf) if no path
     """
-    heap = [(0, start)]
+    if stats is not None:
+        heuristic_fn = stats.counting(heuristic_fn)
+        stats.seed(1)
+    frontier = queue()
+    frontier.push(0, start)
+    decrease_key = getattr(frontier, 'decrease_key', None)
     g_scores = {start: 0}
     f_scores = {start: heuristic_fn(start, goal)}
     came_from = {}
 
-    while heap:
-        _, current = heappop(heap)
+    while frontier:
+        f_score, current = frontier.pop()
+
+        if f_score > f_scores[current]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
 
         if current == goal:
             # Reconstruct path
@@ -156,6 +406,850 @@ def a_star(
                 came_from[neighbor] = current
                 g_scores[neighbor] = tentative_g
                 f_scores[neighbor] = tentative_g + heuristic_fn(neighbor, goal)
-                heappush(heap, (f_scores[neighbor], neighbor))
+                if decrease_key is not None and neighbor in frontier:
+                    decrease_key(f_scores[neighbor], neighbor)
+                else:
+                    frontier.push(f_scores[neighbor], neighbor)
+                    if stats is not None:
+                        stats.pushes += 1
+        if stats is not None:
+            stats.expand(len(frontier))
+
+    return None, float('inf')
+
+
+def dfs_visit(
+    starts: Iterable[T],
+    neighbors_fn: Callable[[T], List[T]],
+    on_enter: Optional[Callable[[T, Optional[T]], None]] = None,
+    on_exit: Optional[Callable[[T, Optional[T]], None]] = None,
+    visited: Optional[Set[T]] = None
+) -> Set[T]:
+    """
+    Depth-first traversal with pre- and post-order hooks and no recursion.
+
+    Each stack frame keeps the node's neighbor iterator, so nodes are
+    entered and exited exactly as in the recursive formulation.
+
+    Args:
+        starts: Nodes to start from, in order (already visited ones are skipped)
+        neighbors_fn: Function that returns neighbors of a node
+        on_enter: Called as on_enter(node, parent) when a node is first reached
+        on_exit: Called as on_exit(node, parent) once all its descendants are done
+        visited: Optional set of nodes to treat as already visited; updated in place
+
+    Returns:
+        Set of all visited nodes
+    """
+    visited = set() if visited is None else visited
+
+    for root in starts:
+        if root in visited:
+            continue
+        visited.add(root)
+        if on_enter:
+            on_enter(root, None)
+        stack = [(root, None, iter(neighbors_fn(root)))]
+
+        while stack:
+            node, parent, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    if on_enter:
+                        on_enter(neighbor, node)
+                    stack.append((neighbor, node, iter(neighbors_fn(neighbor))))
+                    break
+            else:
+                stack.pop()
+                if on_exit:
+                    on_exit(node, parent)
+
+    return visited
+
+
+def strongly_connected_components(
+    nodes: Iterable[T],
+    neighbors_fn: Callable[[T], List[T]]
+) -> List[List[T]]:
+    """
+    Tarjan's strongly connected components, without recursion.
+
+    Args:
+        nodes: Nodes to start from; everything reachable from them is included
+        neighbors_fn: Function that returns neighbors of a node
+
+    Returns:
+        List of components in reverse topological order of the condensation
+        (a component only points to components listed before it)
+    """
+    index: Dict[T, int] = {}
+    low: Dict[T, int] = {}
+    on_stack: Set[T] = set()
+    component_stack: List[T] = []
+    components: List[List[T]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        component_stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(neighbors_fn(root)))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = len(index)
+                    component_stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(neighbors_fn(neighbor))))
+                    break
+                if neighbor in on_stack and index[neighbor] < low[node]:
+                    low[node] = index[neighbor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = component_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def find_cycle(
+    nodes: Iterable[T],
+    neighbors_fn: Callable[[T], List[T]]
+) -> Optional[List[T]]:
+    """
+    Find a directed cycle reachable from the given nodes.
+
+    Args:
+        nodes: Nodes to start from
+        neighbors_fn: Function that returns neighbors of a node
+
+    Returns:
+        The cycle as [n0, n1, ..., n0], or None if the graph is acyclic
+    """
+    done: Set[T] = set()
+
+    for root in nodes:
+        if root in done:
+            continue
+        path = [root]
+        position = {root: 0}  # nodes on the current DFS path
+        work = [iter(neighbors_fn(root))]
+
+        while work:
+            for neighbor in work[-1]:
+                if neighbor in position:
+                    return path[position[neighbor]:] + [neighbor]
+                if neighbor not in done:
+                    position[neighbor] = len(path)
+                    path.append(neighbor)
+                    work.append(iter(neighbors_fn(neighbor)))
+                    break
+            else:
+                work.pop()
+                node = path.pop()
+                del position[node]
+                done.add(node)
+
+    return None
+
+
+def topological_sort(
+    nodes: Iterable[T],
+    neighbors_fn: Callable[[T], List[T]]
+) -> List[T]:
+    """
+    Kahn's topological sort.
+
+    Args:
+        nodes: Nodes to sort; nodes reachable from them are included as well
+        neighbors_fn: Function that returns the nodes a node points to
+
+    Returns:
+        Nodes ordered so every edge goes from an earlier to a later node
+
+    Raises:
+        ValueError: If the graph has a cycle
+    """
+    adjacency: Dict[T, List[T]] = {}
+    indegree: Dict[T, int] = {}
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if node in adjacency:
+            continue
+        adjacency[node] = neighbors = list(neighbors_fn(node))
+        indegree.setdefault(node, 0)
+        for neighbor in neighbors:
+            indegree[neighbor] = indegree.get(neighbor, 0) + 1
+            if neighbor not in adjacency:
+                pending.append(neighbor)
+
+    queue = deque(node for node in adjacency if indegree[node] == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for neighbor in adjacency[node]:
+            indegree[neighbor] -= 1
+            if indegree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if len(order) < len(adjacency):
+        raise ValueError("graph has a cycle")
+    return order
+
+
+def iter_bfs(
+    start: T,
+    neighbors_fn: Callable[[T], List[T]],
+    *,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[T, int]]:
+    """
+    Breadth-first search as a generator.
+
+    Args:
+        start: Starting node
+        neighbors_fn: Function that returns neighbors of a node
+        stats: Optional SearchStats to fill (elapsed is not tracked)
+
+    Yields:
+        (node, distance) in the order nodes are dequeued
+    """
+    queue = deque([start])
+    distances = {start: 0}
+    if stats is not None:
+        stats.seed(1)
+
+    while queue:
+        current = queue.popleft()
+        distance = distances[current]
+        yield current, distance
+
+        for neighbor in neighbors_fn(current):
+            if neighbor not in distances:
+                distances[neighbor] = distance + 1
+                queue.append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+        if stats is not None:
+            stats.expand(len(queue))
+
+
+def iter_dfs(
+    start: T,
+    neighbors_fn: Callable[[T], List[T]],
+    *,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[T, int]]:
+    """
+    Depth-first search as a generator.
+
+    Args:
+        start: Starting node
+        neighbors_fn: Function that returns neighbors of a node
+        stats: Optional SearchStats to fill (elapsed is not tracked)
+
+    Yields:
+        (node, depth) in visiting order, depth being the length of the DFS
+        path that reached the node (not necessarily the shortest)
+    """
+    stack = [(start, 0)]
+    visited = set()
+    if stats is not None:
+        stats.seed(1)
+
+    while stack:
+        current, depth = stack.pop()
+
+        if current in visited:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+
+        visited.add(current)
+        yield current, depth
+
+        size = len(stack)
+        for neighbor in neighbors_fn(current):
+            if neighbor not in visited:
+                stack.append((neighbor, depth + 1))
+        if stats is not None:
+            stats.pushes += len(stack) - size
+            stats.expand(len(stack))
+
+
+def iter_dijkstra(
+    start: T,
+    neighbors_fn: Callable[[T], List[Tuple[T, int]]],
+    queue: Callable[[], PriorityQueue] = HeapQueue,
+    *,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[T, int]]:
+    """
+    Dijkstra's algorithm as a generator.
+
+    Args:
+        start: Starting node
+        neighbors_fn: Function that returns (neighbor, cost) tuples
+        queue: Priority queue class
+        stats: Optional SearchStats to fill (elapsed is not tracked)
+
+    Yields:
+        (node, distance) as each node is settled, in non-decreasing distance
+    """
+    frontier = queue()
+    frontier.push(0, start)
+    decrease_key = getattr(frontier, 'decrease_key', None)
+    distances = {start: 0}
+    if stats is not None:
+        stats.seed(1)
+
+    while frontier:
+        current_dist, current = frontier.pop()
+
+        if current_dist > distances[current]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+
+        yield current, current_dist
+
+        for neighbor, cost in neighbors_fn(current):
+            new_dist = current_dist + cost
+
+            if new_dist < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_dist
+                if decrease_key is not None and neighbor in frontier:
+                    decrease_key(new_dist, neighbor)
+                else:
+                    frontier.push(new_dist, neighbor)
+                    if stats is not None:
+                        stats.pushes += 1
+        if stats is not None:
+            stats.expand(len(frontier))
+
+
+class IncrementalSearch(Generic[T]):
+    """
+    Pausable search that keeps everything it has settled.
+
+    Wraps one of the iter_* generators. Queries are answered from the
+    settled nodes when possible, and otherwise resume the underlying
+    search only as far as needed, so repeated queries from the same
+    source never restart it.
+
+    Example:
+        search = IncrementalSearch(iter_dijkstra(start, neighbors))
+        search.distance_to(a)  # explores until a is settled
+        search.distance_to(b)  # continues from where the first query stopped
+    """
+
+    def __init__(self, steps: Iterator[Tuple[T, int]]):
+        self._steps = steps
+        self.settled: Dict[T, int] = {}
+        self.exhausted = False
+        self._order: List[T] = []
+
+    def _step(self) -> Optional[Tuple[T, int]]:
+        """Settle one more node, or return None once the search is exhausted."""
+        if self.exhausted:
+            return None
+        step = next(self._steps, None)
+        if step is None:
+            self.exhausted = True
+            return None
+        self.settled[step[0]] = step[1]
+        self._order.append(step[0])
+        return step
+
+    def advance(self, n: int = 1) -> List[Tuple[T, int]]:
+        """Settle up to n more nodes and return them."""
+        steps = []
+        while len(steps) < n:
+            step = self._step()
+            if step is None:
+                break
+            steps.append(step)
+        return steps
+
+    def distance_to(self, goal: T) -> float:
+        """Distance to goal, or inf if it is unreachable."""
+        while goal not in self.settled:
+            if self._step() is None:
+                return float('inf')
+        return self.settled[goal]
+
+    def distances_to(self, goals: Iterable[T]) -> Dict[T, float]:
+        """Distances to several goals, resuming the search at most once."""
+        goals = list(goals)
+        pending = {goal for goal in goals if goal not in self.settled}
+        while pending:
+            step = self._step()
+            if step is None:
+                break
+            pending.discard(step[0])
+        return {goal: self.settled.get(goal, float('inf')) for goal in goals}
+
+    def find(self, predicate: Callable[[T], bool]) -> Optional[Tuple[T, int]]:
+        """First node in settle order satisfying predicate, as (node, distance)."""
+        for node in self._order:
+            if predicate(node):
+                return node, self.settled[node]
+        while True:
+            step = self._step()
+            if step is None or predicate(step[0]):
+                return step
+
+    def __iter__(self) -> Iterator[Tuple[T, int]]:
+        """Iterate over all nodes in settle order, resuming the search as needed."""
+        index = 0
+        while index < len(self._order) or self._step() is not None:
+            node = self._order[index]
+            yield node, self.settled[node]
+            index += 1
+
+
+def _join_paths(meet: T, forward_parents: Dict[T, Optional[T]],
+                backward_parents: Dict[T, Optional[T]]) -> List[T]:
+    """Stitch the forward and backward parent chains through the meeting node."""
+    path = []
+    node: Optional[T] = meet
+    while node is not None:
+        path.append(node)
+        node = forward_parents[node]
+    path.reverse()
+    node = backward_parents[meet]
+    while node is not None:
+        path.append(node)
+        node = backward_parents[node]
+    return path
+
+
+@timed
+def bidirectional_bfs(
+    start: T,
+    goal: T,
+    neighbors_fn: Callable[[T], List[T]],
+    reverse_neighbors_fn: Optional[Callable[[T], List[T]]] = None,
+    *,
+    stats: Optional[SearchStats] = None
+) -> Tuple[Optional[List[T]], float]:
+    """
+    Breadth-first search from both ends until the frontiers meet.
+
+    Always expands one full layer of the smaller frontier, so the search
+    stops at the first layer where the two sides touch.
+
+    Args:
+        start: Starting node
+        goal: Goal node
+        neighbors_fn: Function that returns neighbors of a node
+        reverse_neighbors_fn: Function that returns the nodes with an edge into
+            a node (defaults to neighbors_fn, for undirected graphs)
+        stats: Optional SearchStats to fill
+
+    Returns:
+        Tuple of (path from start to goal, path length), or (None, inf) if no path
+    """
+    if start == goal:
+        return [start], 0
+    reverse_neighbors_fn = reverse_neighbors_fn or neighbors_fn
+
+    forward: Dict[T, int] = {start: 0}
+    backward: Dict[T, int] = {goal: 0}
+    forward_parents: Dict[T, Optional[T]] = {start: None}
+    backward_parents: Dict[T, Optional[T]] = {goal: None}
+    forward_frontier, backward_frontier = [start], [goal]
+    best, meet = float('inf'), None
+    if stats is not None:
+        stats.seed(2)
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, distances, parents, other, expand = \
+                forward_frontier, forward, forward_parents, backward, neighbors_fn
+        else:
+            frontier, distances, parents, other, expand = \
+                backward_frontier, backward, backward_parents, forward, reverse_neighbors_fn
+
+        next_frontier = []
+        for node in frontier:
+            distance = distances[node] + 1
+            for neighbor in expand(node):
+                if neighbor not in distances:
+                    distances[neighbor] = distance
+                    parents[neighbor] = node
+                    next_frontier.append(neighbor)
+                    if neighbor in other and distance + other[neighbor] < best:
+                        best, meet = distance + other[neighbor], neighbor
+        if stats is not None:
+            stats.expanded += len(frontier)
+            stats.pushes += len(next_frontier)
+            size = len(forward_frontier) + len(backward_frontier) - len(frontier) + len(next_frontier)
+            stats.peak_frontier = max(stats.peak_frontier, size)
+
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+        if meet is not None:
+            return _join_paths(meet, forward_parents, backward_parents), best
+
+    return None, float('inf')
+
+
+@timed
+def bidirectional_dijkstra(
+    start: T,
+    goal: T,
+    neighbors_fn: Callable[[T], List[Tuple[T, int]]],
+    reverse_neighbors_fn: Optional[Callable[[T], List[Tuple[T, int]]]] = None,
+    *,
+    stats: Optional[SearchStats] = None
+) -> Tuple[Optional[List[T]], float]:
+    """
+    Dijkstra's algorithm run from both ends until the frontiers meet.
+
+    Each step settles a node on the side with the smaller tentative distance.
+    The search stops once the two smallest tentative distances together
+    reach the best start-goal cost seen so far.
+
+    Args:
+        start: Starting node
+        goal: Goal node
+        neighbors_fn: Function that returns (neighbor, cost) tuples
+        reverse_neighbors_fn: Function that returns (predecessor, cost) tuples
+            for a node (defaults to neighbors_fn, for undirected graphs)
+        stats: Optional SearchStats to fill
+
+    Returns:
+        Tuple of (path from start to goal, total cost), or (None, inf) if no path
+    """
+    if start == goal:
+        return [start], 0
+    reverse_neighbors_fn = reverse_neighbors_fn or neighbors_fn
+
+    counter = count()
+    forward: Dict[T, int] = {start: 0}
+    backward: Dict[T, int] = {goal: 0}
+    forward_parents: Dict[T, Optional[T]] = {start: None}
+    backward_parents: Dict[T, Optional[T]] = {goal: None}
+    forward_heap = [(0, next(counter), start)]
+    backward_heap = [(0, next(counter), goal)]
+    best, meet = float('inf'), None
+    if stats is not None:
+        stats.seed(2)
+
+    while forward_heap and backward_heap:
+        if forward_heap[0][0] + backward_heap[0][0] >= best:
+            break
+
+        if forward_heap[0][0] <= backward_heap[0][0]:
+            heap, distances, parents, other, expand = \
+                forward_heap, forward, forward_parents, backward, neighbors_fn
+        else:
+            heap, distances, parents, other, expand = \
+                backward_heap, backward, backward_parents, forward, reverse_neighbors_fn
+
+        current_dist, _, current = heappop(heap)
+        if current_dist > distances[current]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+
+        for neighbor, cost in expand(current):
+            new_dist = current_dist + cost
+            if new_dist < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_dist
+                parents[neighbor] = current
+                heappush(heap, (new_dist, next(counter), neighbor))
+                if stats is not None:
+                    stats.pushes += 1
+            if neighbor in other and distances[neighbor] + other[neighbor] < best:
+                best, meet = distances[neighbor] + other[neighbor], neighbor
+        if stats is not None:
+            stats.expand(len(forward_heap) + len(backward_heap))
+
+    if meet is None:
+        return None, float('inf')
+    return _join_paths(meet, forward_parents, backward_parents), best
+
+
+class GridDistances:
+    """
+    Distances computed by grid_bfs(), stored flat with -1 for unreached cells.
+
+    Supports Point lookups like the dict returned by bfs().
+    """
+
+    def __init__(self, width: int, height: int, distances: array):
+        self.width = width
+        self.height = height
+        self.distances = distances
+
+    def get(self, point: Point, default: Optional[int] = None) -> Optional[int]:
+        """Distance to point, or default if it was not reached."""
+        if 0 <= point.x < self.width and 0 <= point.y < self.height:
+            distance = self.distances[point.y * self.width + point.x]
+            if distance >= 0:
+                return distance
+        return default
+
+    def __getitem__(self, point: Point) -> int:
+        distance = self.get(point)
+        if distance is None:
+            raise KeyError(point)
+        return distance
+
+    def __contains__(self, point: Point) -> bool:
+        return self.get(point) is not None
+
+    def __len__(self) -> int:
+        return len(self.distances) - self.distances.count(-1)
+
+    def items(self) -> Iterator[Tuple[Point, int]]:
+        """Iterate over (point, distance) for every reached cell."""
+        width = self.width
+        for index, distance in enumerate(self.distances):
+            if distance >= 0:
+                y, x = divmod(index, width)
+                yield Point(x, y), distance
+
+    def to_dict(self) -> Dict[Point, int]:
+        """Distances keyed by Point, as returned by bfs()."""
+        return dict(self.items())
+
+
+def _padded_mask(grid: Union[Grid, CompactGrid], passable: Callable[[str], bool]) -> Tuple[bytearray, int]:
+    """Passability mask with a one-cell wall border, and its row width."""
+    width, height = grid.width, grid.height
+    padded_width = width + 2
+    mask = grid.where(passable)
+    open_cells = bytearray(padded_width * (height + 2))
+    for y in range(height):
+        start = (y + 1) * padded_width + 1
+        open_cells[start:start + width] = mask[y * width:(y + 1) * width]
+    return open_cells, padded_width
+
+
+@timed
+def grid_bfs(
+    grid: Union[Grid, CompactGrid],
+    sources: Union[Point, Iterable[Point]],
+    passable: Callable[[str], bool],
+    diagonal: bool = False,
+    goal: Optional[Point] = None,
+    *,
+    stats: Optional[SearchStats] = None
+) -> GridDistances:
+    """
+    Breadth-first search over grid cells using flat indices.
+
+    The passability mask is padded with a one-cell wall border, so neighbors
+    are plain index offsets with no bounds checks, and distances live in an
+    array('i') instead of a dict.
+
+    Args:
+        grid: Grid to search
+        sources: Starting point or (x, y) tuple, or several of them for a
+            multi-source search
+        passable: Function telling whether a cell value can be entered
+        diagonal: Also move diagonally
+        goal: Optional point or (x, y) tuple at which to stop early
+        stats: Optional SearchStats to fill
+
+    Returns:
+        GridDistances mapping reached points to their distance from the nearest source
+    """
+    width, height = grid.width, grid.height
+    open_cells, padded_width = _padded_mask(grid, passable)
+
+    offsets = ORTHOGONAL_OFFSETS + DIAGONAL_OFFSETS if diagonal else ORTHOGONAL_OFFSETS
+    steps = [dy * padded_width + dx for dx, dy in offsets]
+    distances = array('i', [-1]) * len(open_cells)
+    target = -1
+    if goal is not None and 0 <= goal[0] < width and 0 <= goal[1] < height:
+        target = (goal[1] + 1) * padded_width + goal[0] + 1
+
+    # A single point may be a Point or a plain (x, y) tuple
+    if isinstance(sources, tuple) and len(sources) == 2 and all(isinstance(c, int) for c in sources):
+        sources = [sources]
+    queue = deque()
+    for x, y in sources:
+        if 0 <= x < width and 0 <= y < height:
+            index = (y + 1) * padded_width + x + 1
+            if distances[index] < 0:
+                distances[index] = 0
+                open_cells[index] = 0
+                queue.append(index)
+
+    if stats is not None:
+        stats.seed(len(queue))
+
+    while queue:
+        current = queue.popleft()
+        if current == target:
+            break
+        size = len(queue)
+        distance = distances[current] + 1
+        for step in steps:
+            neighbor = current + step
+            if open_cells[neighbor]:
+                open_cells[neighbor] = 0
+                distances[neighbor] = distance
+                queue.append(neighbor)
+        if stats is not None:
+            stats.pushes += len(queue) - size
+            stats.expand(len(queue))
+
+    result = array('i')
+    for y in range(height):
+        start = (y + 1) * padded_width + 1
+        result.extend(distances[start:start + width])
+    return GridDistances(width, height, result)
+
+
+@timed
+def jump_point_search(
+    grid: Union[Grid, CompactGrid],
+    start: Point,
+    goal: Point,
+    passable: Callable[[str], bool],
+    *,
+    stats: Optional[SearchStats] = None
+) -> Tuple[Optional[List[Point]], int]:
+    """
+    Jump point search for 4-connected grids where every step costs 1.
+
+    A* that only pushes jump points: from each node it scans straight
+    ahead over cells that have a symmetric path through another route,
+    stopping at the goal or at a cell with a forced neighbor (an open side
+    cell whose counterpart one step back is blocked). A vertical scan also
+    stops where a horizontal scan from it would find a jump point, which is
+    what keeps the 4-connected variant optimal. Scans run on a padded flat
+    mask, so they are plain index arithmetic.
+
+    Args:
+        grid: Grid to search
+        start: Starting point
+        goal: Goal point
+        passable: Function telling whether a cell value can be entered
+        stats: Optional SearchStats to fill (expanded counts jump points)
+
+    Returns:
+        Tuple of (path from start to goal, total cost), or (None, inf) if no
+        path; the same costs as a_star() with manhattan_distance
+    """
+    width, height = grid.width, grid.height
+    if not (0 <= start.x < width and 0 <= start.y < height
+            and 0 <= goal.x < width and 0 <= goal.y < height):
+        return None, float('inf')
+    if start == goal:
+        return [start], 0
+
+    open_cells, padded_width = _padded_mask(grid, passable)
+    source = (start.y + 1) * padded_width + start.x + 1
+    target = (goal.y + 1) * padded_width + goal.x + 1
+    goal_x, goal_y = goal.x + 1, goal.y + 1
+
+    def jump_horizontal(index: int, step: int) -> int:
+        while open_cells[index]:
+            if index == target \
+                    or (open_cells[index - padded_width] and not open_cells[index - step - padded_width]) \
+                    or (open_cells[index + padded_width] and not open_cells[index - step + padded_width]):
+                return index
+            index += step
+        return -1
+
+    def jump_vertical(index: int, step: int) -> int:
+        while open_cells[index]:
+            if index == target \
+                    or (open_cells[index - 1] and not open_cells[index - 1 - step]) \
+                    or (open_cells[index + 1] and not open_cells[index + 1 - step]) \
+                    or jump_horizontal(index + 1, 1) >= 0 \
+                    or jump_horizontal(index - 1, -1) >= 0:
+                return index
+            index += step
+        return -1
+
+    def heuristic(index: int) -> int:
+        y, x = divmod(index, padded_width)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    # Directions to scan from a node, given the step that reached it
+    vertical_scans = ((padded_width, jump_vertical), (-padded_width, jump_vertical))
+    horizontal_scans = ((1, jump_horizontal), (-1, jump_horizontal))
+
+    g_scores = {source: 0}
+    came_from = {}
+    heap = [(heuristic(source), source)]
+    if stats is not None:
+        stats.seed(1)
+        stats.heuristic_calls += 1
+
+    while heap:
+        f_score, current = heappop(heap)
+        g_score = g_scores[current]
+        if f_score > g_score + heuristic(current):
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+
+        if current == target:
+            corners = [current]
+            while current in came_from:
+                current = came_from[current]
+                corners.append(current)
+            corners.reverse()
+            path = []
+            for here, there in zip(corners, corners[1:]):
+                step = 1 if abs(there - here) < padded_width else padded_width
+                if there < here:
+                    step = -step
+                path.extend(range(here, there, step))
+            path.append(target)
+            return [Point(index % padded_width - 1, index // padded_width - 1) for index in path], g_score
+
+        parent = came_from.get(current)
+        if parent is None:
+            moves = horizontal_scans + vertical_scans
+        elif abs(current - parent) < padded_width:
+            step = 1 if current > parent else -1
+            moves = vertical_scans + ((step, jump_horizontal),)
+        else:
+            step = padded_width if current > parent else -padded_width
+            moves = horizontal_scans + ((step, jump_vertical),)
+
+        for step, jump in moves:
+            jump_point = jump(current + step, step)
+            if jump_point < 0:
+                continue
+            distance = jump_point - current
+            tentative_g = g_score + (abs(distance) if step in (1, -1) else abs(distance) // padded_width)
+            if tentative_g < g_scores.get(jump_point, float('inf')):
+                g_scores[jump_point] = tentative_g
+                came_from[jump_point] = current
+                heappush(heap, (tentative_g + heuristic(jump_point), jump_point))
+                if stats is not None:
+                    stats.pushes += 1
+                    stats.heuristic_calls += 1
+        if stats is not None:
+            stats.expand(len(heap))
 
     return None, float('inf')
@@ -1,7 +1,13 @@
 """Utilities for reading and parsing input files."""
 
+import mmap
+import os
+import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Iterator, Tuple, Union, TextIO
+
+from .grid import CompactGrid
 
 
 def read_input(filepath: str) -> str:
@@ -59,8 +65,8 @@ def read_grid(filepath: str) -> List[List[str]]:
     Returns:
         2D list representing the grid
     """
-    lines = read_lines(filepath)
-    return [list(line) for line in lines if line]
+    data = read_input(filepath)
+    return [list(line) for line in data.splitlines()]
 
 
 def read_sections(filepath: str, separator: str = '\n\n') -> List[str]:
@@ -114,6 +120,178 @@ def read_columns(filepath: str) -> List[List[str]]:
     return [list(col) for col in zip(*rows)]
 
 
-def read_grid(filepath: str) -> List[List[str]]:
-    data = read_input(filepath)
-    return [list(line) for line in data.splitlines()]
+Source = Union[str, TextIO]
+
+
+@contextmanager
+def _open_source(source: Source) -> Iterator[TextIO]:
+    """Open a path for reading; '-' means stdin and open file objects are used as is."""
+    if source == '-':
+        yield sys.stdin
+    elif isinstance(source, str):
+        with open(source, 'r') as f:
+            yield f
+    else:
+        yield source
+
+
+def iter_lines(source: Source, strip: bool = True) -> Iterator[str]:
+    """
+    Lazily yield lines from a file, open file object or stdin.
+
+    Args:
+        source: Path to the input file, an open text file, or '-' for stdin
+        strip: Whether to strip whitespace from each line
+
+    Yields:
+        Lines from the source, one at a time
+    """
+    with _open_source(source) as f:
+        for line in f:
+            yield line.strip() if strip else line
+
+
+def iter_parsed(source: Source, parser: Callable[[str], Any]) -> Iterator[Any]:
+    """
+    Lazily apply a custom parser to each non-blank line.
+
+    Args:
+        source: Path to the input file, an open text file, or '-' for stdin
+        parser: Function to apply to each line
+
+    Yields:
+        Parsed values, one per non-blank line
+    """
+    for line in iter_lines(source):
+        if line:
+            yield parser(line)
+
+
+def iter_sections(source: Source) -> Iterator[List[str]]:
+    """
+    Lazily yield blank-line-delimited sections as lists of lines.
+
+    Only the current section is held in memory.
+
+    Args:
+        source: Path to the input file, an open text file, or '-' for stdin
+
+    Yields:
+        The stripped lines of each section
+    """
+    section: List[str] = []
+    for line in iter_lines(source):
+        if line:
+            section.append(line)
+        elif section:
+            yield section
+            section = []
+    if section:
+        yield section
+
+
+def read_bytes(filepath: str) -> bytes:
+    """
+    Read the entire input file as bytes, without decoding.
+
+    Args:
+        filepath: Path to the input file
+
+    Returns:
+        The complete file contents as bytes
+    """
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+class MappedInput:
+    """
+    Read-only memory map of an input file.
+
+    Lines are returned as memoryview slices of the mapping, so nothing is
+    copied or decoded until the caller asks for it. Views must be released
+    (or dropped) before the MappedInput is closed.
+    """
+
+    def __init__(self, filepath: str):
+        self._file = open(filepath, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            # mmap cannot map an empty file
+            self.buffer: Union[mmap.mmap, bytes] = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+            )
+        except Exception:
+            self._file.close()
+            raise
+        self.view = memoryview(self.buffer)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def line_spans(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, stop) offsets of each line, without the line terminator."""
+        buffer = self.buffer
+        start, size = 0, len(buffer)
+        while start < size:
+            end = buffer.find(b'\n', start)
+            if end == -1:
+                end = size
+            stop = end - 1 if end > start and buffer[end - 1] == 13 else end  # drop '\r'
+            yield start, stop
+            start = end + 1
+
+    def lines(self) -> Iterator[memoryview]:
+        """Yield each line as a memoryview, without the line terminator."""
+        view = self.view
+        for start, stop in self.line_spans():
+            yield view[start:stop]
+
+    def close(self) -> None:
+        """Release the mapping and the underlying file."""
+        self.view.release()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedInput':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_grid_mmap(filepath: str) -> CompactGrid:
+    """
+    Read a rectangular grid straight from a memory-mapped file into a CompactGrid.
+
+    Rows are copied from the mapping into one preallocated bytearray, so
+    peak memory stays close to the size of the grid itself.
+
+    Args:
+        filepath: Path to the input file
+
+    Returns:
+        CompactGrid holding the file's cells
+    """
+    with MappedInput(filepath) as mapped:
+        # First pass only measures, so no row objects are kept alive
+        width, height, blank_tail = None, 0, 0
+        for y, (start, stop) in enumerate(mapped.line_spans()):
+            if start == stop:
+                blank_tail += 1
+                continue
+            if blank_tail:
+                raise ValueError(f"row {y - blank_tail} is blank")
+            if width is not None and stop - start != width:
+                raise ValueError(f"row {y} has length {stop - start}, expected {width}")
+            width = stop - start
+            height += 1
+
+        width = width or 0
+        cells = bytearray(width * height)
+        view = mapped.view
+        for y, (start, _) in zip(range(height), mapped.line_spans()):
+            cells[y * width:(y + 1) * width] = view[start:start + width]
+
+    return CompactGrid(width, height, cells)
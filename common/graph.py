@@ -0,0 +1,308 @@
+"""Static graphs in compressed sparse row (CSR) form."""
+
+from array import array
+from heapq import heappush, heappop
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from .algorithms import SearchStats, timed
+
+T = TypeVar('T', bound=Hashable)
+
+Number = Union[int, float]
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _weight_array(weights: List[Number]) -> Sequence[Number]:
+    """
+    Pack edge weights as 64-bit ints when they all are, as doubles otherwise.
+
+    Integer weights outside the int64 range stay in a plain list, so they
+    are never truncated or rounded.
+    """
+    if all(type(weight) is int for weight in weights):
+        if weights and not (_INT64_MIN <= min(weights) and max(weights) <= _INT64_MAX):
+            return list(weights)
+        return array('q', weights)
+    return array('d', weights)
+
+
+class Graph(Generic[T]):
+    """
+    Directed graph materialized once into CSR arrays.
+
+    Nodes get dense ids 0..n-1 in discovery order. The edges leaving node
+    id u are targets[offsets[u]:offsets[u + 1]], with matching costs in
+    weights (None for unweighted graphs, where every edge costs 1). The
+    searches work on ids and array slices, so repeated queries on the same
+    graph never call the original neighbors function again.
+
+    Example:
+        graph = Graph.from_neighbors([start], neighbors)
+        distances = graph.bfs(start)
+    """
+
+    def __init__(self, nodes: List[T], offsets: array, targets: array,
+                 weights: Optional[Sequence[Number]] = None):
+        self.nodes = nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.ids: Dict[T, int] = {node: node_id for node_id, node in enumerate(nodes)}
+
+    @classmethod
+    def from_neighbors(
+        cls,
+        starts: Iterable[T],
+        neighbors_fn: Callable[[T], Iterable],
+        weighted: bool = False
+    ) -> 'Graph[T]':
+        """
+        Build the graph reachable from starts.
+
+        Args:
+            starts: Nodes to explore from
+            neighbors_fn: Function returning neighbors of a node, or
+                (neighbor, cost) tuples when weighted
+            weighted: Whether neighbors_fn returns costs, as for dijkstra()
+        """
+        nodes: List[T] = []
+        ids: Dict[T, int] = {}
+        for start in starts:
+            if start not in ids:
+                ids[start] = len(nodes)
+                nodes.append(start)
+
+        offsets = array('i', [0])
+        targets = array('i')
+        costs: List[Number] = []
+        node_id = 0
+        while node_id < len(nodes):
+            for entry in neighbors_fn(nodes[node_id]):
+                if weighted:
+                    neighbor, cost = entry
+                    costs.append(cost)
+                else:
+                    neighbor = entry
+                neighbor_id = ids.get(neighbor)
+                if neighbor_id is None:
+                    neighbor_id = ids[neighbor] = len(nodes)
+                    nodes.append(neighbor)
+                targets.append(neighbor_id)
+            offsets.append(len(targets))
+            node_id += 1
+
+        return cls(nodes, offsets, targets, _weight_array(costs) if weighted else None)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence], directed: bool = True) -> 'Graph[T]':
+        """
+        Build a graph from (u, v) or (u, v, cost) edges.
+
+        Args:
+            edges: Edges as 2-tuples, or 3-tuples for a weighted graph
+            directed: Add each edge in one direction only
+        """
+        nodes: List[T] = []
+        ids: Dict[T, int] = {}
+        sources = array('i')
+        targets = array('i')
+        costs: List[Number] = []
+        weighted = None
+
+        def node_id(node: T) -> int:
+            found = ids.get(node)
+            if found is None:
+                found = ids[node] = len(nodes)
+                nodes.append(node)
+            return found
+
+        for edge in edges:
+            if weighted is None:
+                weighted = len(edge) == 3
+            u, v = node_id(edge[0]), node_id(edge[1])
+            sources.append(u)
+            targets.append(v)
+            if weighted:
+                costs.append(edge[2])
+            if not directed:
+                sources.append(v)
+                targets.append(u)
+                if weighted:
+                    costs.append(edge[2])
+
+        # Counting sort of the edges by source
+        offsets = array('i', [0]) * (len(nodes) + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(len(nodes)):
+            offsets[u + 1] += offsets[u]
+        position = offsets[:-1]
+        sorted_targets = array('i', [0]) * len(targets)
+        sorted_costs: List[Number] = [0] * len(costs)
+        for edge_index, u in enumerate(sources):
+            slot = position[u]
+            position[u] = slot + 1
+            sorted_targets[slot] = targets[edge_index]
+            if weighted:
+                sorted_costs[slot] = costs[edge_index]
+
+        return cls(nodes, offsets, sorted_targets, _weight_array(sorted_costs) if weighted else None)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: T) -> bool:
+        return node in self.ids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def degree(self, node: T) -> int:
+        """Number of edges leaving node."""
+        node_id = self.ids[node]
+        return self.offsets[node_id + 1] - self.offsets[node_id]
+
+    def neighbors(self, node: T) -> List[T]:
+        """Nodes that node has an edge to."""
+        node_id = self.ids[node]
+        nodes = self.nodes
+        return [nodes[target] for target in self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]]
+
+    def edges(self, node: T) -> List[Tuple[T, Number]]:
+        """(neighbor, cost) pairs of the edges leaving node."""
+        node_id = self.ids[node]
+        start, end = self.offsets[node_id], self.offsets[node_id + 1]
+        nodes = self.nodes
+        costs = self.weights[start:end] if self.weights is not None else [1] * (end - start)
+        return [(nodes[target], cost) for target, cost in zip(self.targets[start:end], costs)]
+
+    @timed
+    def bfs_ids(self, sources: Iterable[int], *, stats: Optional[SearchStats] = None) -> array:
+        """
+        Multi-source BFS over node ids.
+
+        Args:
+            sources: Node ids at distance 0
+            stats: Optional SearchStats to fill
+
+        Returns:
+            array('i') of distances indexed by node id, -1 where unreachable
+        """
+        offsets, targets = self.offsets, self.targets
+        distances = array('i', [-1]) * len(self.nodes)
+        frontier = []
+        for source in sources:
+            if distances[source] < 0:
+                distances[source] = 0
+                frontier.append(source)
+        if stats is not None:
+            stats.seed(len(frontier))
+
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for node_id in frontier:
+                for target in targets[offsets[node_id]:offsets[node_id + 1]]:
+                    if distances[target] < 0:
+                        distances[target] = depth
+                        next_frontier.append(target)
+            if stats is not None:
+                stats.expanded += len(frontier)
+                stats.pushes += len(next_frontier)
+                stats.peak_frontier = max(stats.peak_frontier, len(next_frontier))
+            frontier = next_frontier
+
+        return distances
+
+    def bfs(self, start: T, *, stats: Optional[SearchStats] = None) -> Dict[T, int]:
+        """
+        Breadth-first search from start, like algorithms.bfs().
+
+        Args:
+            start: Starting node
+            stats: Optional SearchStats to fill
+
+        Returns:
+            Dictionary mapping reachable nodes to their distance from start
+        """
+        distances = self.bfs_ids([self.ids[start]], stats=stats)
+        return {node: distance for node, distance in zip(self.nodes, distances) if distance >= 0}
+
+    @timed
+    def dijkstra_ids(
+        self,
+        sources: Iterable[int],
+        goal: Optional[int] = None,
+        *,
+        stats: Optional[SearchStats] = None
+    ) -> List[Number]:
+        """
+        Multi-source Dijkstra over node ids.
+
+        Node ids are ints, so heap entries are plain (distance, id) tuples
+        without a tiebreak counter.
+
+        Args:
+            sources: Node ids at distance 0
+            goal: Optional node id to stop at once it is settled
+            stats: Optional SearchStats to fill
+
+        Returns:
+            List of distances indexed by node id, inf where unreachable
+            (or not reached before goal was settled)
+        """
+        if self.weights is None:
+            distances = self.bfs_ids(sources, stats=stats)
+            return [float('inf') if distance < 0 else distance for distance in distances]
+
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        inf = float('inf')
+        distances: List[Number] = [inf] * len(self.nodes)
+        heap: List[Tuple[Number, int]] = []
+        for source in sources:
+            distances[source] = 0
+            heap.append((0, source))
+        if stats is not None:
+            stats.seed(len(heap))
+
+        while heap:
+            distance, node_id = heappop(heap)
+            if distance > distances[node_id]:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+            if node_id == goal:
+                break
+            for edge in range(offsets[node_id], offsets[node_id + 1]):
+                target = targets[edge]
+                new_distance = distance + weights[edge]
+                if new_distance < distances[target]:
+                    distances[target] = new_distance
+                    heappush(heap, (new_distance, target))
+                    if stats is not None:
+                        stats.pushes += 1
+            if stats is not None:
+                stats.expand(len(heap))
+
+        return distances
+
+    def dijkstra(self, start: T, goal: Optional[T] = None, *,
+                 stats: Optional[SearchStats] = None) -> Dict[T, Number]:
+        """
+        Dijkstra's shortest path algorithm from start, like algorithms.dijkstra().
+
+        Args:
+            start: Starting node
+            goal: Optional node to stop at once it is settled
+            stats: Optional SearchStats to fill
+
+        Returns:
+            Dictionary mapping reached nodes to their shortest distance from start
+        """
+        goal_id = self.ids[goal] if goal is not None else None
+        distances = self.dijkstra_ids([self.ids[start]], goal_id, stats=stats)
+        inf = float('inf')
+        return {node: distance for node, distance in zip(self.nodes, distances) if distance != inf}
@@ -1,13 +1,20 @@
 """Common grid and point utilities for 2D grid problems."""
 
+import re
+from array import array
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple, Set, Optional, Iterator
+from typing import List, Tuple, Set, Optional, Iterator, Iterable, Sequence, Union, Callable, NamedTuple, Dict
 
 
-@dataclass(frozen=True)
-class Point:
-    """Represents a point in 2D space."""
+class Point(NamedTuple):
+    """
+    Represents a point in 2D space.
+
+    A tuple subclass: instances carry no __dict__, and construction,
+    hashing and equality run in C. Points compare equal to plain (x, y)
+    tuples and order lexicographically by (x, y).
+    """
     x: int
     y: int
 
@@ -20,28 +27,48 @@ class Point:
     def __mul__(self, scalar: int) -> 'Point':
         return Point(self.x * scalar, self.y * scalar)
 
+    __rmul__ = __mul__
+
     def manhattan_distance(self, other: 'Point') -> int:
         """Calculate Manhattan distance to another point."""
         return abs(self.x - other.x) + abs(self.y - other.y)
 
     def neighbors(self, diagonal: bool = False) -> List['Point']:
         """Get adjacent points (4 or 8 directions)."""
+        x, y = self
         points = [
-            Point(self.x + 1, self.y),
-            Point(self.x - 1, self.y),
-            Point(self.x, self.y + 1),
-            Point(self.x, self.y - 1),
+            Point(x + 1, y),
+            Point(x - 1, y),
+            Point(x, y + 1),
+            Point(x, y - 1),
         ]
         if diagonal:
             points.extend([
-                Point(self.x + 1, self.y + 1),
-                Point(self.x + 1, self.y - 1),
-                Point(self.x - 1, self.y + 1),
-                Point(self.x - 1, self.y - 1),
+                Point(x + 1, y + 1),
+                Point(x + 1, y - 1),
+                Point(x - 1, y + 1),
+                Point(x - 1, y - 1),
             ])
         return points
 
 
+# Packed coordinates: a single int per point for dict/set keys in hot loops.
+# Each coordinate must fit in a signed 32-bit range.
+PACK_STRIDE = 1 << 32
+_PACK_BIAS = 1 << 31
+
+
+def pack_point(x: int, y: int) -> int:
+    """Encode coordinates as a single int key."""
+    return y * PACK_STRIDE + x
+
+
+def unpack_point(key: int) -> Point:
+    """Decode a key produced by pack_point."""
+    y, x = divmod(key + _PACK_BIAS, PACK_STRIDE)
+    return Point(x - _PACK_BIAS, y)
+
+
 class Direction(Enum):
     """Cardinal directions."""
     NORTH = Point(0, -1)
@@ -80,6 +107,112 @@ class Direction(Enum):
         return reverses[self]
 
 
+@dataclass
+class Components:
+    """Connected components found by label_components()."""
+    width: int
+    labels: array  # flat row-major labels; 0 means not in any component
+    sizes: List[int]  # cell count of label n at index n - 1
+    boxes: List[Tuple[int, int, int, int]]  # (min_x, min_y, max_x, max_y) of label n at index n - 1
+
+    @property
+    def count(self) -> int:
+        """Number of components."""
+        return len(self.sizes)
+
+    def label_at(self, point: Point) -> int:
+        """Label of the component containing point, or 0."""
+        return self.labels[point.y * self.width + point.x]
+
+    def points(self, label: int) -> List[Point]:
+        """All cells of a component."""
+        min_x, min_y, max_x, max_y = self.boxes[label - 1]
+        labels, width = self.labels, self.width
+        return [
+            Point(x, y)
+            for y in range(min_y, max_y + 1)
+            for x in range(min_x, max_x + 1)
+            if labels[y * width + x] == label
+        ]
+
+
+_RUN = re.compile(rb'\x01+')
+
+
+def _label_mask(mask: bytes, width: int, height: int, diagonal: bool) -> Components:
+    """
+    Label the connected 1-cells of a flat 0/1 mask.
+
+    Works on horizontal runs rather than cells: runs are found per row with
+    a regex, runs touching a run of the previous row are merged in a
+    union-find over run ids, and a second pass writes one label per run.
+    """
+    runs: List[Tuple[int, int]] = []  # flat (start, end) of every run
+    parent: List[int] = []
+    reach = 1 if diagonal else 0
+
+    def find(run: int) -> int:
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
+
+    previous: List[Tuple[int, int, int]] = []
+    for y in range(height):
+        current = []
+        count = len(previous)
+        first = 0  # first run of the previous row that may still touch
+        for match in _RUN.finditer(mask, y * width, (y + 1) * width):
+            start, end = match.span()
+            run = root = len(parent)
+            parent.append(run)
+            runs.append((start, end))
+            current.append((start, end, run))
+
+            # Same columns one row up, widened by one for diagonal contact
+            low, high = start - width - reach, end - width + reach
+            while first < count and previous[first][1] <= low:
+                first += 1
+            k = first
+            while k < count and previous[k][0] < high:
+                other = find(previous[k][2])
+                if root == run:
+                    parent[run] = root = other
+                elif other != root:
+                    parent[other] = root
+                k += 1
+        previous = current
+
+    labels = array('i', [0]) * (width * height)
+    sizes: List[int] = []
+    min_xs: List[int] = []
+    min_ys: List[int] = []
+    max_xs: List[int] = []
+    max_ys: List[int] = []
+    label_of: Dict[int, int] = {}
+    for run, (start, end) in enumerate(runs):
+        root = find(run)
+        y, x = divmod(start, width)
+        label = label_of.get(root)
+        if label is None:
+            label = label_of[root] = len(sizes) + 1
+            sizes.append(0)
+            min_xs.append(x)
+            min_ys.append(y)
+            max_xs.append(x)
+            max_ys.append(y)
+        index = label - 1
+        sizes[index] += end - start
+        if x < min_xs[index]:
+            min_xs[index] = x
+        if x + end - start - 1 > max_xs[index]:
+            max_xs[index] = x + end - start - 1
+        max_ys[index] = y
+        labels[start:end] = array('i', [label]) * (end - start)
+
+    return Components(width, labels, sizes, list(zip(min_xs, min_ys, max_xs, max_ys)))
+
+
 class Grid:
     """2D grid with common operations."""
 
@@ -132,6 +265,40 @@ class Grid:
             if self.in_bounds(neighbor):
                 yield neighbor
 
+    def where(self, predicate: Callable[[str], bool]) -> bytearray:
+        """Flat row-major 0/1 mask of the cells whose value satisfies predicate."""
+        values = set()
+        for row in self.data:
+            values.update(row)
+        table = {ord(value): '\x01' if predicate(value) else '\x00' for value in values}
+        return bytearray(
+            ''.join(''.join(row).translate(table) for row in self.data).encode('latin-1')
+        )
+
+    def label_components(self, predicate: Callable[[str], bool],
+                         diagonal: bool = False) -> Components:
+        """
+        Label the connected regions of cells whose value satisfies predicate.
+
+        Args:
+            predicate: Test applied to each cell value
+            diagonal: Treat diagonal neighbors as connected
+
+        Returns:
+            Components with a flat label array, sizes and bounding boxes
+        """
+        return _label_mask(self.where(predicate), self.width, self.height, diagonal)
+
+    def neighbor_counts(self, symbol: str, diagonal: bool = False) -> bytearray:
+        """Flat row-major neighbor counts of symbol; see CompactGrid.neighbor_counts."""
+        return CompactGrid.from_grid(self).neighbor_counts(symbol, diagonal)
+
+    def neighbor_mask(self, symbol: str, predicate: Callable[[int], bool],
+                      diagonal: bool = False,
+                      where: Optional[str] = None) -> Tuple[bytearray, bytearray]:
+        """Flat neighbor counts and predicate mask; see CompactGrid.neighbor_mask."""
+        return CompactGrid.from_grid(self).neighbor_mask(symbol, predicate, diagonal, where)
+
     def __str__(self) -> str:
         """String representation of the grid."""
         return '\n'.join(''.join(row) for row in self.data)
@@ -139,3 +306,613 @@ class Grid:
     def copy(self) -> 'Grid':
         """Create a deep copy of the grid."""
         return Grid([row[:] for row in self.data])
+
+
+# (dx, dy) offsets for the 4- and 8-neighborhood, in the same order as Point.neighbors
+ORTHOGONAL_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL_OFFSETS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class CompactGrid:
+    """
+    2D grid of single-byte cells stored row-major in one bytearray.
+
+    Cells are addressed either by Point (same API as Grid) or by flat
+    index ``y * width + x``. The flat-index methods avoid allocating a
+    Point per access and are the ones to use in hot loops.
+    """
+
+    def __init__(self, width: int, height: int,
+                 cells: Optional[Union[bytes, bytearray]] = None, fill: str = '.'):
+        """
+        Initialize grid of the given size.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+            cells: Optional row-major cell bytes; a bytearray is used without copying
+            fill: Value for every cell when no cells are given
+        """
+        if cells is None:
+            cells = bytearray(fill.encode() * (width * height))
+        elif not isinstance(cells, bytearray):
+            cells = bytearray(cells)
+        if len(cells) != width * height:
+            raise ValueError(f"expected {width * height} cells, got {len(cells)}")
+
+        self.cells = cells
+        self.width = width
+        self.height = height
+        # (dx, dy, flat offset) triples for neighbor lookups
+        self._offsets = {
+            False: tuple((dx, dy, dy * width + dx) for dx, dy in ORTHOGONAL_OFFSETS),
+            True: tuple((dx, dy, dy * width + dx) for dx, dy in ORTHOGONAL_OFFSETS + DIAGONAL_OFFSETS),
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[str, bytes, Sequence[str]]]) -> 'CompactGrid':
+        """Build a grid from rows given as strings, bytes or lists of characters."""
+        cells = bytearray()
+        width = None
+        height = 0
+        for row in rows:
+            if isinstance(row, str):
+                row = row.encode()
+            elif not isinstance(row, (bytes, bytearray, memoryview)):
+                row = ''.join(row).encode()
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"row {height} has length {len(row)}, expected {width}")
+            cells += row
+            height += 1
+        return cls(width or 0, height, cells)
+
+    @classmethod
+    def from_grid(cls, grid: Grid) -> 'CompactGrid':
+        """Build a compact copy of a list-backed Grid."""
+        return cls.from_rows(grid.data)
+
+    def to_grid(self) -> Grid:
+        """Convert to a list-backed Grid."""
+        return Grid([list(self.row(y).decode()) for y in range(self.height)])
+
+    # -------------------------
+    # Flat index access
+    # -------------------------
+    def index(self, x: int, y: int) -> int:
+        """Flat index of the cell at (x, y)."""
+        return y * self.width + x
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        """(x, y) coordinates of a flat index."""
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def point(self, index: int) -> Point:
+        """Point for a flat index."""
+        y, x = divmod(index, self.width)
+        return Point(x, y)
+
+    def get_at(self, index: int) -> str:
+        """Value at a flat index."""
+        return chr(self.cells[index])
+
+    def set_at(self, index: int, value: str) -> None:
+        """Set value at a flat index."""
+        self.cells[index] = ord(value)
+
+    def neighbor_indices(self, index: int, diagonal: bool = False) -> List[int]:
+        """Flat indices of the in-bounds neighbors of a flat index."""
+        width = self.width
+        height = self.height
+        y, x = divmod(index, width)
+        return [
+            index + delta
+            for dx, dy, delta in self._offsets[diagonal]
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        ]
+
+    # -------------------------
+    # Bulk access
+    # -------------------------
+    def row(self, y: int) -> bytes:
+        """Raw bytes of row y."""
+        start = y * self.width
+        return bytes(self.cells[start:start + self.width])
+
+    def rows(self) -> Iterator[bytes]:
+        """Iterate over the raw bytes of every row."""
+        for y in range(self.height):
+            yield self.row(y)
+
+    def count(self, value: str) -> int:
+        """Number of cells holding value."""
+        return self.cells.count(ord(value))
+
+    def find_indices(self, value: str) -> List[int]:
+        """Flat indices of all cells holding value."""
+        cells = self.cells
+        target = ord(value)
+        indices = []
+        index = cells.find(target)
+        while index != -1:
+            indices.append(index)
+            index = cells.find(target, index + 1)
+        return indices
+
+    def fill(self, value: str) -> None:
+        """Set every cell to value."""
+        self.cells[:] = value.encode() * len(self.cells)
+
+    def replace(self, old: str, new: str) -> None:
+        """Replace every occurrence of old with new."""
+        self.cells[:] = self.cells.replace(old.encode(), new.encode())
+
+    # -------------------------
+    # Whole-grid kernels
+    # -------------------------
+    def mask(self, symbol: str) -> bytearray:
+        """Flat 0/1 mask of the cells holding symbol."""
+        table = bytearray(256)
+        table[ord(symbol)] = 1
+        return self.cells.translate(table)
+
+    def where(self, predicate: Callable[[str], bool]) -> bytearray:
+        """Flat 0/1 mask of the cells whose value satisfies predicate."""
+        table = bytes(1 if predicate(chr(value)) else 0 for value in range(256))
+        return self.cells.translate(table)
+
+    def neighbor_counts(self, symbol: str, diagonal: bool = False) -> bytearray:
+        """
+        Count neighbors holding symbol for every cell in one pass.
+
+        The symbol mask is packed into a single big int with one byte
+        lane per cell, so each shifted copy of the grid is one C-level
+        integer operation. Counts never exceed 8, so lanes cannot carry
+        into each other.
+
+        Args:
+            symbol: Cell value to count
+            diagonal: Count the 8-neighborhood instead of the 4-neighborhood
+
+        Returns:
+            Flat bytearray of per-cell neighbor counts
+        """
+        width, size = self.width, len(self.cells)
+        if size == 0:
+            return bytearray()
+
+        hits = int.from_bytes(self.mask(symbol), 'big')
+        full = (1 << (8 * size)) - 1
+        not_first_col = int.from_bytes((b'\x00' + b'\xff' * (width - 1)) * self.height, 'big')
+        not_last_col = int.from_bytes((b'\xff' * (width - 1) + b'\x00') * self.height, 'big')
+        row_shift = 8 * width
+
+        from_left = (hits >> 8) & not_first_col
+        from_right = (hits << 8) & not_last_col
+        if diagonal:
+            band = hits + from_left + from_right
+            total = from_left + from_right + (band >> row_shift) + ((band << row_shift) & full)
+        else:
+            total = from_left + from_right + (hits >> row_shift) + ((hits << row_shift) & full)
+        return bytearray(total.to_bytes(size, 'big'))
+
+    def neighbor_mask(self, symbol: str, predicate: Callable[[int], bool],
+                      diagonal: bool = False,
+                      where: Optional[str] = None) -> Tuple[bytearray, bytearray]:
+        """
+        Neighbor counts plus a mask of the cells whose count satisfies predicate.
+
+        Args:
+            symbol: Cell value to count in the neighborhood
+            predicate: Test applied to each neighbor count (0-8)
+            diagonal: Count the 8-neighborhood instead of the 4-neighborhood
+            where: Optional cell value the cell itself must hold to be in the mask
+
+        Returns:
+            Tuple of (flat counts, flat 0/1 mask)
+        """
+        counts = self.neighbor_counts(symbol, diagonal)
+        table = bytearray(256)
+        for count in range(9):
+            table[count] = 1 if predicate(count) else 0
+        mask = counts.translate(table)
+
+        if where is not None and mask:
+            size = len(mask)
+            selected = int.from_bytes(mask, 'big') & int.from_bytes(self.mask(where), 'big')
+            mask = bytearray(selected.to_bytes(size, 'big'))
+        return counts, mask
+
+    def label_components(self, predicate: Callable[[str], bool],
+                         diagonal: bool = False) -> Components:
+        """
+        Label the connected regions of cells whose value satisfies predicate.
+
+        Args:
+            predicate: Test applied to each cell value
+            diagonal: Treat diagonal neighbors as connected
+
+        Returns:
+            Components with a flat label array, sizes and bounding boxes
+        """
+        return _label_mask(self.where(predicate), self.width, self.height, diagonal)
+
+    # -------------------------
+    # Grid compatible API
+    # -------------------------
+    def get(self, point: Point, default: Optional[str] = None) -> Optional[str]:
+        """Get value at point, return default if out of bounds."""
+        if 0 <= point.x < self.width and 0 <= point.y < self.height:
+            return chr(self.cells[point.y * self.width + point.x])
+        return default
+
+    def set(self, point: Point, value: str) -> None:
+        """Set value at point."""
+        if 0 <= point.x < self.width and 0 <= point.y < self.height:
+            self.cells[point.y * self.width + point.x] = ord(value)
+
+    def in_bounds(self, point: Point) -> bool:
+        """Check if point is within grid bounds."""
+        return 0 <= point.x < self.width and 0 <= point.y < self.height
+
+    def find(self, value: str) -> Optional[Point]:
+        """Find first occurrence of value in grid."""
+        index = self.cells.find(ord(value))
+        return self.point(index) if index != -1 else None
+
+    def find_all(self, value: str) -> List[Point]:
+        """Find all occurrences of value in grid."""
+        return [self.point(index) for index in self.find_indices(value)]
+
+    def neighbors(self, point: Point, diagonal: bool = False) -> Iterator[Point]:
+        """Get valid neighboring points."""
+        for dx, dy, _ in self._offsets[diagonal]:
+            x, y = point.x + dx, point.y + dy
+            if 0 <= x < self.width and 0 <= y < self.height:
+                yield Point(x, y)
+
+    def __str__(self) -> str:
+        """String representation of the grid."""
+        return '\n'.join(row.decode() for row in self.rows())
+
+    def copy(self) -> 'CompactGrid':
+        """Create a copy of the grid."""
+        return CompactGrid(self.width, self.height, bytearray(self.cells))
+
+
+class BitGrid:
+    """
+    Boolean grid storing one bit per cell.
+
+    Each row is a Python int with bit x holding column x, so whole-row
+    operations (shifts, and/or/xor, popcount) run in C. A 10k x 10k board
+    takes about 12 MB.
+    """
+
+    def __init__(self, width: int, height: int, rows: Optional[List[int]] = None):
+        """
+        Initialize grid of the given size.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+            rows: Optional row bitmasks; all cells are off when omitted
+        """
+        self.width = width
+        self.height = height
+        self.rows = rows if rows is not None else [0] * height
+        self._full = (1 << width) - 1
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[str, bytes]], on: str = '#') -> 'BitGrid':
+        """Build a grid from text rows, setting the cells equal to on."""
+        table = bytearray(b'0' * 256)
+        table[ord(on)] = ord('1')
+        bits = []
+        width = None
+        for row in rows:
+            if isinstance(row, str):
+                row = row.encode()
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"row {len(bits)} has length {len(row)}, expected {width}")
+            bits.append(int(bytes(row).translate(table)[::-1], 2) if width else 0)
+        return cls(width or 0, len(bits), bits)
+
+    @classmethod
+    def from_grid(cls, grid: Union[Grid, CompactGrid], on: str = '#') -> 'BitGrid':
+        """Build a grid from a Grid or CompactGrid, setting the cells equal to on."""
+        if isinstance(grid, CompactGrid):
+            return cls.from_rows(grid.rows(), on)
+        return cls.from_rows((''.join(row) for row in grid.data), on)
+
+    def _row_str(self, y: int, on: str, off: str) -> str:
+        return format(self.rows[y], f'0{self.width}b')[::-1].translate(
+            str.maketrans('01', off + on)) if self.width else ''
+
+    def to_grid(self, on: str = '#', off: str = '.') -> Grid:
+        """Convert to a list-backed Grid."""
+        return Grid([list(self._row_str(y, on, off)) for y in range(self.height)])
+
+    def to_compact(self, on: str = '#', off: str = '.') -> CompactGrid:
+        """Convert to a CompactGrid."""
+        return CompactGrid.from_rows(self._row_str(y, on, off) for y in range(self.height))
+
+    # -------------------------
+    # Cell access
+    # -------------------------
+    def get(self, point: Point) -> bool:
+        """Get the bit at point; out of bounds is off."""
+        if 0 <= point.x < self.width and 0 <= point.y < self.height:
+            return (self.rows[point.y] >> point.x) & 1 == 1
+        return False
+
+    def set(self, point: Point, value: bool = True) -> None:
+        """Set or clear the bit at point."""
+        if 0 <= point.x < self.width and 0 <= point.y < self.height:
+            if value:
+                self.rows[point.y] |= 1 << point.x
+            else:
+                self.rows[point.y] &= ~(1 << point.x)
+
+    def in_bounds(self, point: Point) -> bool:
+        """Check if point is within grid bounds."""
+        return 0 <= point.x < self.width and 0 <= point.y < self.height
+
+    def count(self) -> int:
+        """Number of cells that are on."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def find_all(self) -> List[Point]:
+        """All cells that are on, in row-major order."""
+        points = []
+        for y, row in enumerate(self.rows):
+            while row:
+                low = row & -row
+                points.append(Point(low.bit_length() - 1, y))
+                row ^= low
+        return points
+
+    # -------------------------
+    # Whole-grid operations
+    # -------------------------
+    def shifted(self, dx: int, dy: int) -> 'BitGrid':
+        """Grid moved by (dx, dy); bits shifted past the edges are dropped."""
+        full = self._full
+        if dx >= 0:
+            rows = [(row << dx) & full for row in self.rows]
+        else:
+            rows = [row >> -dx for row in self.rows]
+        if dy > 0:
+            rows = [0] * min(dy, self.height) + rows[:max(self.height - dy, 0)]
+        elif dy < 0:
+            rows = rows[-dy:] + [0] * min(-dy, self.height)
+        return BitGrid(self.width, self.height, rows)
+
+    def _neighbor_rows(self, y: int, diagonal: bool) -> List[int]:
+        """Row bitmasks whose bit x is set when that neighbor of (x, y) is on."""
+        full = self._full
+        rows = self.rows
+        row = rows[y]
+        addends = [(row << 1) & full, row >> 1]
+        for other_y in (y - 1, y + 1):
+            if 0 <= other_y < self.height:
+                other = rows[other_y]
+                addends.append(other)
+                if diagonal:
+                    addends.append((other << 1) & full)
+                    addends.append(other >> 1)
+        return addends
+
+    def neighbors_any(self, diagonal: bool = False) -> 'BitGrid':
+        """Grid of the cells with at least one neighbor on."""
+        rows = []
+        for y in range(self.height):
+            merged = 0
+            for addend in self._neighbor_rows(y, diagonal):
+                merged |= addend
+            rows.append(merged)
+        return BitGrid(self.width, self.height, rows)
+
+    def neighbor_count_mask(self, predicate: Callable[[int], bool],
+                            diagonal: bool = False) -> 'BitGrid':
+        """
+        Grid of the cells whose number of neighbors that are on satisfies predicate.
+
+        Neighbor counts are accumulated per row with bit-sliced addition:
+        plane i holds bit i of every cell's count, so each addend costs a
+        few whole-row operations regardless of the width.
+        """
+        full = self._full
+        selected = [count for count in range(9) if predicate(count)]
+        rows = []
+        for y in range(self.height):
+            planes = [0, 0, 0, 0]
+            for carry in self._neighbor_rows(y, diagonal):
+                for i in range(4):
+                    if not carry:
+                        break
+                    planes[i], carry = planes[i] ^ carry, planes[i] & carry
+
+            merged = 0
+            for count in selected:
+                match = full
+                for i in range(4):
+                    match &= planes[i] if (count >> i) & 1 else ~planes[i]
+                merged |= match
+            rows.append(merged)
+        return BitGrid(self.width, self.height, rows)
+
+    def _combine(self, other: 'BitGrid', op: Callable[[int, int], int]) -> 'BitGrid':
+        if (self.width, self.height) != (other.width, other.height):
+            raise ValueError("grids must have the same size")
+        return BitGrid(self.width, self.height, [op(a, b) for a, b in zip(self.rows, other.rows)])
+
+    def __and__(self, other: 'BitGrid') -> 'BitGrid':
+        return self._combine(other, int.__and__)
+
+    def __or__(self, other: 'BitGrid') -> 'BitGrid':
+        return self._combine(other, int.__or__)
+
+    def __xor__(self, other: 'BitGrid') -> 'BitGrid':
+        return self._combine(other, int.__xor__)
+
+    def __invert__(self) -> 'BitGrid':
+        return BitGrid(self.width, self.height, [~row & self._full for row in self.rows])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self.width, self.height, self.rows) == (other.width, other.height, other.rows)
+
+    def __str__(self) -> str:
+        """String representation of the grid ('#' on, '.' off)."""
+        return '\n'.join(self._row_str(y, '#', '.') for y in range(self.height))
+
+    def copy(self) -> 'BitGrid':
+        """Create a copy of the grid."""
+        return BitGrid(self.width, self.height, self.rows[:])
+
+
+class SparseGrid:
+    """
+    Unbounded grid storing only occupied cells.
+
+    Cells live in a dict keyed by pack_point() ints, so memory is
+    proportional to the occupied cells and the grid can grow in any
+    direction. Setting a cell to the background value empties it.
+    """
+
+    def __init__(self, background: str = '.'):
+        """
+        Initialize an empty grid.
+
+        Args:
+            background: Value of every cell that is not stored
+        """
+        self.cells: Dict[int, str] = {}
+        self.background = background
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+        self._bounds_stale = False
+
+    @classmethod
+    def from_grid(cls, grid: Union[Grid, CompactGrid], background: str = '.') -> 'SparseGrid':
+        """Build a sparse grid holding the non-background cells of a dense grid."""
+        sparse = cls(background)
+        for y in range(grid.height):
+            for x in range(grid.width):
+                value = grid.get(Point(x, y))
+                if value != background:
+                    sparse.set(Point(x, y), value)
+        return sparse
+
+    def get(self, point: Point, default: Optional[str] = None) -> Optional[str]:
+        """Get value at point; an empty cell gives default, or the background if None."""
+        return self.cells.get(point.y * PACK_STRIDE + point.x,
+                              self.background if default is None else default)
+
+    def set(self, point: Point, value: str) -> None:
+        """Set value at point; the background value empties the cell."""
+        if value == self.background:
+            self.discard(point)
+            return
+
+        x, y = point
+        self.cells[y * PACK_STRIDE + x] = value
+        if self._bounds is None:
+            if not self._bounds_stale:
+                self._bounds = (x, y, x, y)
+        else:
+            min_x, min_y, max_x, max_y = self._bounds
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                self._bounds = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+
+    def discard(self, point: Point) -> None:
+        """Empty the cell at point."""
+        if self.cells.pop(point.y * PACK_STRIDE + point.x, None) is None:
+            return
+        if self._bounds is not None:
+            min_x, min_y, max_x, max_y = self._bounds
+            if point.x in (min_x, max_x) or point.y in (min_y, max_y):
+                # The box may shrink; recompute lazily on the next query
+                self._bounds = None
+                self._bounds_stale = True
+
+    @property
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """Bounding box (min_x, min_y, max_x, max_y) of the occupied cells, or None if empty."""
+        if self._bounds_stale:
+            points = [unpack_point(key) for key in self.cells]
+            self._bounds = (
+                min(p.x for p in points), min(p.y for p in points),
+                max(p.x for p in points), max(p.y for p in points),
+            ) if points else None
+            self._bounds_stale = False
+        return self._bounds
+
+    @property
+    def width(self) -> int:
+        """Width of the bounding box."""
+        bounds = self.bounds
+        return bounds[2] - bounds[0] + 1 if bounds else 0
+
+    @property
+    def height(self) -> int:
+        """Height of the bounding box."""
+        bounds = self.bounds
+        return bounds[3] - bounds[1] + 1 if bounds else 0
+
+    def in_bounds(self, point: Point) -> bool:
+        """Check if point is within the bounding box of the occupied cells."""
+        bounds = self.bounds
+        return bounds is not None and \
+            bounds[0] <= point.x <= bounds[2] and bounds[1] <= point.y <= bounds[3]
+
+    def find(self, value: str) -> Optional[Point]:
+        """Find an occurrence of value in grid."""
+        for key, cell in self.cells.items():
+            if cell == value:
+                return unpack_point(key)
+        return None
+
+    def find_all(self, value: str) -> List[Point]:
+        """Find all occurrences of value in grid."""
+        return [unpack_point(key) for key, cell in self.cells.items() if cell == value]
+
+    def neighbors(self, point: Point, diagonal: bool = False) -> Iterator[Point]:
+        """Get neighboring points; the grid is unbounded so all of them are valid."""
+        yield from point.neighbors(diagonal)
+
+    def items(self) -> Iterator[Tuple[Point, str]]:
+        """Iterate over (point, value) for every occupied cell."""
+        for key, value in self.cells.items():
+            yield unpack_point(key), value
+
+    def __contains__(self, point: Point) -> bool:
+        return point.y * PACK_STRIDE + point.x in self.cells
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __str__(self) -> str:
+        """String representation of the bounding box."""
+        bounds = self.bounds
+        if bounds is None:
+            return ''
+        min_x, min_y, max_x, max_y = bounds
+        cells, background = self.cells, self.background
+        return '\n'.join(
+            ''.join(cells.get(y * PACK_STRIDE + x, background) for x in range(min_x, max_x + 1))
+            for y in range(min_y, max_y + 1)
+        )
+
+    def copy(self) -> 'SparseGrid':
+        """Create a copy of the grid."""
+        sparse = SparseGrid(self.background)
+        sparse.cells = dict(self.cells)
+        sparse._bounds = self._bounds
+        sparse._bounds_stale = self._bounds_stale
+        return sparse
@@ -0,0 +1,235 @@
+"""Priority queues for the shortest-path searches."""
+
+from heapq import heappush, heappop
+from itertools import count
+from typing import Any, Dict, List, Tuple
+
+
+class PriorityQueue:
+    """Min-priority queue interface used by dijkstra() and a_star()."""
+
+    def push(self, priority: Any, item: Any) -> None:
+        """Add item with the given priority."""
+        raise NotImplementedError
+
+    def pop(self) -> Tuple[Any, Any]:
+        """Remove and return the (priority, item) pair with the smallest priority."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+class HeapQueue(PriorityQueue):
+    """
+    Binary heap with an insertion counter as tiebreak.
+
+    Items never get compared, so nodes do not need to be orderable.
+    Equal priorities pop in insertion order.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._counter = count()
+
+    def push(self, priority: Any, item: Any) -> None:
+        heappush(self._heap, (priority, next(self._counter), item))
+
+    def pop(self) -> Tuple[Any, Any]:
+        priority, _, item = heappop(self._heap)
+        return priority, item
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketQueue(PriorityQueue):
+    """
+    Dial's bucket queue for non-negative integer priorities.
+
+    Monotone: a pushed priority may not be smaller than the last popped
+    one, which holds for Dijkstra and for A* with a consistent heuristic.
+    Push is O(1) and pop skips at most max-edge-weight empty buckets.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, List[Any]] = {}
+        self._cursor = 0
+        self._size = 0
+
+    def push(self, priority: int, item: Any) -> None:
+        if priority < self._cursor:
+            raise ValueError(f"priority {priority} is below the last popped priority {self._cursor}")
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = []
+        bucket.append(item)
+        self._size += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        if not self._size:
+            raise IndexError("pop from empty queue")
+        buckets = self._buckets
+        while self._cursor not in buckets:
+            self._cursor += 1
+        bucket = buckets[self._cursor]
+        item = bucket.pop()
+        if not bucket:
+            del buckets[self._cursor]
+        self._size -= 1
+        return self._cursor, item
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class RadixHeap(PriorityQueue):
+    """
+    Radix heap for non-negative integer priorities.
+
+    Entries are bucketed by the highest bit in which their priority differs
+    from the last popped one; pop redistributes one bucket at a time, so
+    each entry moves O(log C) times. Monotone like BucketQueue.
+    """
+
+    def __init__(self):
+        self._buckets: List[List[Tuple[int, Any]]] = [[]]
+        self._last = 0
+        self._size = 0
+
+    def push(self, priority: int, item: Any) -> None:
+        if priority < self._last:
+            raise ValueError(f"priority {priority} is below the last popped priority {self._last}")
+        index = (priority ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append((priority, item))
+        self._size += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        if not self._size:
+            raise IndexError("pop from empty queue")
+        buckets = self._buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            bucket, buckets[index] = buckets[index], []
+            last = self._last = min(entry[0] for entry in bucket)
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self._size -= 1
+        return buckets[0].pop()
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class IndexedHeap(PriorityQueue):
+    """
+    Binary heap holding each item at most once, with decrease_key.
+
+    A position index maps every queued item to its heap slot, so a better
+    priority for a queued item moves its entry instead of adding another.
+    The heap never holds more entries than distinct items and never yields
+    stale ones; dijkstra() and a_star() call decrease_key automatically
+    when the queue has it. Items must be hashable.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._position: Dict[Any, int] = {}
+        self._counter = count()
+
+    def push(self, priority: Any, item: Any) -> None:
+        if item in self._position:
+            raise ValueError(f"{item!r} is already queued, use decrease_key")
+        self._heap.append((priority, next(self._counter), item))
+        self._position[item] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> Tuple[Any, Any]:
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from empty queue")
+        last = heap.pop()
+        if heap:
+            priority, _, item = heap[0]
+            heap[0] = last
+            self._position[last[2]] = 0
+            self._sift_down(0)
+        else:
+            priority, _, item = last
+        del self._position[item]
+        return priority, item
+
+    def decrease_key(self, priority: Any, item: Any) -> None:
+        """Lower the priority of a queued item."""
+        index = self._position[item]
+        old_priority, order, _ = self._heap[index]
+        if priority > old_priority:
+            raise ValueError(f"priority {priority} is above the current priority {old_priority}")
+        self._heap[index] = (priority, order, item)
+        self._sift_up(index)
+
+    def push_or_decrease(self, priority: Any, item: Any) -> bool:
+        """
+        Queue item, or lower its priority if it is queued with a higher one.
+
+        Returns:
+            True if a new entry was added
+        """
+        index = self._position.get(item)
+        if index is None:
+            self.push(priority, item)
+            return True
+        if priority < self._heap[index][0]:
+            self.decrease_key(priority, item)
+        return False
+
+    def priority_of(self, item: Any) -> Any:
+        """Current priority of a queued item."""
+        return self._heap[self._position[item]][0]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._position
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _sift_up(self, index: int) -> None:
+        heap, position = self._heap, self._position
+        entry = heap[index]
+        key = entry[:2]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[parent][:2] <= key:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][2]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index: int) -> None:
+        heap, position = self._heap, self._position
+        size = len(heap)
+        entry = heap[index]
+        key = entry[:2]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][:2] < heap[child][:2]:
+                child += 1
+            if key <= heap[child][:2]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][2]] = index
+            index = child
+        heap[index] = entry
+        position[entry[2]] = index
@@ -0,0 +1,224 @@
+"""Memoization and state-space DP with bounded caches."""
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+S = TypeVar('S')
+R = TypeVar('R')
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters of a BoundedCache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (f"hits={self.hits} misses={self.misses} evictions={self.evictions} "
+                f"hit_rate={self.hit_rate:.1%}")
+
+
+class BoundedCache:
+    """
+    LRU cache bounded by entry count and/or total weight.
+
+    Without limits it behaves like a plain dict with statistics. With
+    maxweight, each entry weighs weigh(key, value), which defaults to
+    the shallow sys.getsizeof of both, and least recently used entries
+    are evicted to stay under the budget.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, maxweight: Optional[int] = None,
+                 weigh: Optional[Callable[[Any, Any], int]] = None):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigh = weigh or (lambda key, value: sys.getsizeof(key) + sys.getsizeof(value))
+        self.stats = CacheStats()
+        self.weight = 0
+        self._data: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look up key, counting a hit or a miss."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        if self.maxsize is not None or self.maxweight is not None:
+            self._data.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting least recently used entries if needed."""
+        weight = self.weigh(key, value) if self.maxweight is not None else 0
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.weight -= old[1]
+        self._data[key] = (value, weight)
+        self.weight += weight
+
+        while self._data and (
+            (self.maxsize is not None and len(self._data) > self.maxsize)
+            or (self.maxweight is not None and self.weight > self.maxweight)
+        ):
+            _, (_, evicted_weight) = self._data.popitem(last=False)
+            self.weight -= evicted_weight
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        self._data.clear()
+        self.weight = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def memoize(maxsize: Optional[int] = None, maxweight: Optional[int] = None,
+            weigh: Optional[Callable[[Any, Any], int]] = None,
+            key: Optional[Callable[..., Hashable]] = None) -> Callable:
+    """
+    Decorator caching a function in a BoundedCache.
+
+    The cache is exposed as the wrapper's .cache attribute, with hit/miss
+    statistics in .cache.stats. Recursion still uses the Python stack; for
+    deep state spaces use solve() instead.
+
+    Args:
+        maxsize: Maximum number of cached results
+        maxweight: Maximum total weight of cached results
+        weigh: Weight of a (key, result) pair, see BoundedCache
+        key: Function building the cache key from the call arguments
+            (defaults to the positional arguments plus sorted keyword arguments)
+    """
+    def decorator(function: Callable[..., R]) -> Callable[..., R]:
+        cache = BoundedCache(maxsize, maxweight, weigh)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else \
+                (args + tuple(sorted(kwargs.items())) if kwargs else args)
+            result = cache.get(cache_key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.put(cache_key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def solve(
+    root: S,
+    subproblems: Callable[[S], Iterable[S]],
+    combine: Callable[[S, List[R]], R],
+    cache: Optional[BoundedCache] = None,
+    key: Optional[Callable[[S], Hashable]] = None
+) -> R:
+    """
+    Evaluate a recursive state-space DP with an explicit stack.
+
+    The value of a state is combine(state, [values of its subproblems]);
+    states without subproblems are base cases. Subproblems are solved
+    depth-first without Python recursion, so arbitrarily deep state spaces
+    never hit the recursion limit. Values are memoized in cache; pending
+    subproblem results are held on the stack, so a bounded cache only
+    costs recomputation, never correctness.
+
+    Args:
+        root: State to evaluate
+        subproblems: Function returning the states a state depends on
+        combine: Function computing a state's value from its subproblem values
+        cache: Cache to use and keep between calls (defaults to an unbounded one)
+        key: Function mapping a state to its cache key, e.g. StatePacker.pack
+
+    Returns:
+        The value of root
+
+    Raises:
+        ValueError: If the states depend on each other cyclically
+    """
+    if cache is None:
+        cache = BoundedCache()
+    key = key or (lambda state: state)
+
+    root_key = key(root)
+    value = cache.get(root_key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    stack = [(root, root_key, iter(subproblems(root)), [])]
+    on_stack = {root_key}
+    while True:
+        state, state_key, children, results = stack[-1]
+        for child in children:
+            child_key = key(child)
+            value = cache.get(child_key, _MISSING)
+            if value is not _MISSING:
+                results.append(value)
+                continue
+            if child_key in on_stack:
+                raise ValueError(f"cyclic dependency through state {child!r}")
+            on_stack.add(child_key)
+            stack.append((child, child_key, iter(subproblems(child)), []))
+            break
+        else:
+            stack.pop()
+            on_stack.discard(state_key)
+            value = combine(state, results)
+            cache.put(state_key, value)
+            if not stack:
+                return value
+            stack[-1][3].append(value)
+
+
+class StatePacker:
+    """
+    Packs tuples of small non-negative ints into a single int.
+
+    Cache keys become one int instead of a tuple, which hashes faster and
+    takes a fraction of the memory.
+
+    Example:
+        packer = StatePacker([8, 8, 16])  # bits per field
+        key = packer.pack((x, y, steps))
+    """
+
+    def __init__(self, bits: Sequence[int]):
+        self.bits = list(bits)
+        self.shifts = []
+        shift = 0
+        for width in self.bits:
+            self.shifts.append(shift)
+            shift += width
+
+    def pack(self, state: Sequence[int]) -> int:
+        """Encode a state tuple as an int."""
+        packed = 0
+        for value, width, shift in zip(state, self.bits, self.shifts):
+            if not 0 <= value < (1 << width):
+                raise ValueError(f"{value} does not fit in {width} bits")
+            packed |= value << shift
+        return packed
+
+    def unpack(self, packed: int) -> Tuple[int, ...]:
+        """Decode an int produced by pack()."""
+        return tuple((packed >> shift) & ((1 << width) - 1)
+                     for width, shift in zip(self.bits, self.shifts))
@@ -0,0 +1,150 @@
+"""Minimum spanning trees: Kruskal over edge streams and Borůvka over point sets."""
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .pairs import Coordinates
+from .spatial import KDTree
+from .union_find import DenseUnionFind
+
+Edge = Tuple[int, int, int]  # (weight, i, j)
+
+
+@dataclass
+class MSTResult:
+    """Outcome of an MST run."""
+    edges: List[Edge] = field(default_factory=list)  # accepted, in acceptance order
+    total: int = 0  # sum of accepted weights
+    attempted: int = 0  # edges looked at (nearest-neighbor queries for boruvka)
+    last_edge: Optional[Edge] = None  # last accepted edge
+    union_find: Optional[DenseUnionFind] = None  # components after the run
+
+    @property
+    def connected(self) -> bool:
+        """True if the accepted edges span every node."""
+        return self.union_find.is_connected()
+
+
+def kruskal(
+    n: int,
+    edges: Iterable[Edge],
+    max_accepted: Optional[int] = None,
+    max_attempted: Optional[int] = None,
+    stop_when_connected: bool = True
+) -> MSTResult:
+    """
+    Kruskal's algorithm over a stream of edges in non-decreasing weight.
+
+    The stream is consumed lazily, so closest_pairs() or a sorted
+    candidate_edges() list can be fed directly and only as many edges as
+    needed get generated.
+
+    Args:
+        n: Number of nodes, ids 0..n-1
+        edges: (weight, i, j) edges sorted by weight
+        max_accepted: Stop after this many edges joined two components
+        max_attempted: Stop after looking at this many edges, accepted or not
+        stop_when_connected: Stop as soon as every node is in one component
+
+    Returns:
+        MSTResult; its union_find tracks component sizes (top_sizes() etc.)
+    """
+    union_find = DenseUnionFind(n, track_sizes=True)
+    result = MSTResult(union_find=union_find)
+    if (max_accepted is not None and max_accepted <= 0) \
+            or (max_attempted is not None and max_attempted <= 0) \
+            or (stop_when_connected and union_find.is_connected()):
+        return result
+
+    for edge in edges:
+        result.attempted += 1
+        weight, i, j = edge
+        if union_find.union(i, j):
+            result.edges.append(edge)
+            result.total += weight
+            result.last_edge = edge
+            if len(result.edges) == max_accepted \
+                    or (stop_when_connected and union_find.is_connected()):
+                break
+        if result.attempted == max_attempted:
+            break
+
+    return result
+
+
+def boruvka(points: Sequence[Coordinates], tree: Optional[KDTree] = None) -> MSTResult:
+    """
+    Exact Euclidean minimum spanning tree of a point set by Borůvka rounds.
+
+    Each round finds, for every component, its shortest edge to another
+    component with KDTree.nearest_outside(), pruning subtrees that lie
+    entirely in the query's component and anything farther than the
+    component's best edge so far; then all those edges are merged. A
+    point's answer is reused in later rounds while it still lies in
+    another component. Every round at least halves the component count,
+    so there are O(log N) rounds and no quadratic pair enumeration.
+
+    Weights are squared distances, as in closest_pairs(); the tree is the
+    same as for plain distances.
+
+    Args:
+        points: Points as coordinate tuples
+        tree: Optional prebuilt KDTree over points
+
+    Returns:
+        MSTResult with edges sorted by weight, so last_edge is the longest
+        edge, the one a Kruskal run would finish with
+    """
+    n = len(points)
+    tree = tree or KDTree(points)
+    union_find = DenseUnionFind(n, track_sizes=True)
+    result = MSTResult(union_find=union_find)
+
+    # Nearest point outside each point's component, from earlier rounds.
+    # Components only grow, so it stays exact while it is still outside,
+    # and a bounded search that found nothing leaves a valid lower bound.
+    nearest: List[Optional[Tuple[int, int]]] = [None] * n
+    floor: List[float] = [0] * n
+
+    while not union_find.is_connected():
+        labels = [union_find.find(i) for i in range(n)]
+        cheapest = {}
+        stale = []
+        for i in range(n):
+            found = nearest[i]
+            if found is None or labels[found[1]] == labels[i]:
+                stale.append(i)
+                continue
+            distance, j = found
+            edge = (distance, i, j) if i < j else (distance, j, i)
+            current = cheapest.get(labels[i])
+            if current is None or edge < current:
+                cheapest[labels[i]] = edge
+
+        # Reused answers already bound each component's search
+        uniform = tree.uniform_labels(labels) if stale else None
+        for i in stale:
+            component = labels[i]
+            current = cheapest.get(component)
+            bound = current[0] if current else float('inf')
+            if floor[i] >= bound:
+                continue
+            found = nearest[i] = tree.nearest_outside(i, labels, uniform, bound)
+            result.attempted += 1
+            if found is None:
+                floor[i] = bound
+                continue
+            distance, j = found
+            floor[i] = distance
+            cheapest[component] = (distance, i, j) if i < j else (distance, j, i)
+
+        for edge in sorted(cheapest.values()):
+            weight, i, j = edge
+            if union_find.union(i, j):
+                result.edges.append(edge)
+                result.total += weight
+
+    result.edges.sort()
+    if result.edges:
+        result.last_edge = result.edges[-1]
+    return result
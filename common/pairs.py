@@ -0,0 +1,115 @@
+"""Lazy enumeration of point pairs in increasing distance."""
+
+from itertools import product
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+Coordinates = Sequence[int]
+
+
+def squared_distance(a: Coordinates, b: Coordinates) -> int:
+    """Squared Euclidean distance; exact for integer coordinates."""
+    return sum((p - q) * (p - q) for p, q in zip(a, b))
+
+
+def _squared_distance_for(dimensions: int) -> Callable[[Coordinates, Coordinates], int]:
+    """squared_distance() unrolled for 2D and 3D, where the generator dominates."""
+    if dimensions == 2:
+        return lambda a, b: (a[0] - b[0]) * (a[0] - b[0]) + (a[1] - b[1]) * (a[1] - b[1])
+    if dimensions == 3:
+        return lambda a, b: ((a[0] - b[0]) * (a[0] - b[0]) + (a[1] - b[1]) * (a[1] - b[1])
+                             + (a[2] - b[2]) * (a[2] - b[2]))
+    return squared_distance
+
+
+def _pairs_within(points: Sequence[Coordinates], lows: Sequence[int], radius,
+                  low, high) -> List[Tuple[int, int, int]]:
+    """All pairs with low < squared distance <= high, found through cells of size radius."""
+    # Cell coordinates are packed into one int per cell, with a spare cell
+    # on each side of every axis so neighbor deltas never wrap
+    dimensions = len(lows)
+    squared_distance = _squared_distance_for(dimensions)
+    strides = []
+    stride = 1
+    for d in range(dimensions):
+        strides.append(stride)
+        stride *= int((max(p[d] for p in points) - lows[d]) // radius) + 3
+    cells: Dict[int, List[int]] = {}
+    for index, point in enumerate(points):
+        key = 0
+        for c, lowest, step in zip(point, lows, strides):
+            key += (int((c - lowest) // radius) + 1) * step
+        cells.setdefault(key, []).append(index)
+
+    deltas = [sum(o * step for o, step in zip(offset, strides))
+              for offset in product((-1, 0, 1), repeat=dimensions)]
+    deltas = [delta for delta in deltas if delta > 0]
+
+    found = []
+    for key, members in cells.items():
+        for position, i in enumerate(members):
+            a = points[i]
+            for j in members[position + 1:]:
+                distance = squared_distance(a, points[j])
+                if low < distance <= high:
+                    found.append((distance, i, j))
+        for delta in deltas:
+            others = cells.get(key + delta)
+            if not others:
+                continue
+            for i in members:
+                a = points[i]
+                for j in others:
+                    distance = squared_distance(a, points[j])
+                    if low < distance <= high:
+                        found.append((distance, i, j) if i < j else (distance, j, i))
+    return found
+
+
+def closest_pairs(points: Sequence[Coordinates], batch: int = 1024) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield every pair of points in increasing distance, without sorting all pairs.
+
+    Pairs are produced in rounds by squared-distance band: a round hashes
+    the points into cells as wide as the current radius, collects the
+    pairs whose squared distance falls in (previous radius², radius²],
+    sorts just those and yields them, then doubles the radius. Bands are
+    cut by value, so equal distances always land in the same round and
+    the order matches a full sort. Taking the first k pairs costs roughly
+    the pairs within the k-th distance instead of all N²/2.
+
+    Args:
+        points: Points as coordinate tuples of equal dimension
+        batch: Rough number of pairs the first round should produce
+
+    Yields:
+        (squared distance, i, j) with i < j indices into points, ordered by
+        squared distance, then i, then j (the order of sorting combinations)
+    """
+    if len(points) < 2:
+        return
+
+    dimensions = len(points[0])
+    lows = [min(p[d] for p in points) for d in range(dimensions)]
+    extents = [max(p[d] for p in points) - lows[d] for d in range(dimensions)]
+    diameter_squared = sum(extent * extent for extent in extents)
+    if diameter_squared == 0:
+        yield from ((0, i, j) for i in range(len(points)) for j in range(i + 1, len(points)))
+        return
+
+    # Side of a cube expected to hold about batch pairs for uniform points
+    volume = 1
+    for extent in extents:
+        volume *= max(extent, 1)
+    side = (2 * batch * volume / (len(points) * len(points))) ** (1 / dimensions)
+    radius = max(1, int(side / 2)) if all(type(c) is int for c in points[0]) else side / 2
+
+    low = -1
+    while True:
+        high = radius * radius
+        found = _pairs_within(points, lows, radius, low, high)
+        found.sort()
+        yield from found
+        if high >= diameter_squared:
+            return
+        low = high
+        radius *= 2
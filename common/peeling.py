@@ -0,0 +1,136 @@
+"""Peel-until-stable removal driven by incremental neighbor counts."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, TypeVar
+
+from .grid import CompactGrid
+
+T = TypeVar('T', bound=Hashable)
+
+
+@dataclass
+class PeelResult(Generic[T]):
+    """Outcome of a peeling run."""
+    removed: List[T] = field(default_factory=list)  # in removal order
+    rounds: List[int] = field(default_factory=list)  # removals per round
+
+    @property
+    def total(self) -> int:
+        """Total number of removed nodes."""
+        return len(self.removed)
+
+
+def peel(
+    nodes: Iterable[T],
+    neighbors_fn: Callable[[T], Iterable[T]],
+    removable: Callable[[int], bool]
+) -> PeelResult[T]:
+    """
+    Repeatedly remove every node whose count of remaining neighbors is removable.
+
+    Each round removes all currently removable nodes at once. Instead of
+    rescanning, neighbor counts are decremented as nodes disappear and the
+    affected neighbors are re-tested once the round is done, so the total
+    work is O(nodes + removals * degree). Testing only final counts keeps
+    the result identical to a full rescan for any predicate, not just ones
+    that stay true as counts fall.
+
+    Args:
+        nodes: Nodes present at the start
+        neighbors_fn: Function that returns neighbors of a node
+        removable: Test applied to a node's count of remaining neighbors
+
+    Returns:
+        PeelResult with removed nodes and removals per round
+    """
+    alive = set(nodes)
+    counts: Dict[T, int] = {
+        node: sum(1 for neighbor in neighbors_fn(node) if neighbor in alive)
+        for node in alive
+    }
+    frontier = [node for node in alive if removable(counts[node])]
+    queued = set(frontier)
+    result: PeelResult[T] = PeelResult()
+
+    while frontier:
+        result.rounds.append(len(frontier))
+        result.removed.extend(frontier)
+        alive.difference_update(frontier)
+
+        touched = []
+        for node in frontier:
+            for neighbor in neighbors_fn(node):
+                if neighbor in alive:
+                    counts[neighbor] -= 1
+                    touched.append(neighbor)
+
+        # Test on the counts left after the whole round, not mid-round
+        next_frontier = []
+        for neighbor in touched:
+            if neighbor not in queued and removable(counts[neighbor]):
+                queued.add(neighbor)
+                next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return result
+
+
+def peel_grid(
+    grid: CompactGrid,
+    symbol: str,
+    removable: Callable[[int], bool],
+    diagonal: bool = False,
+    replacement: str = '.'
+) -> PeelResult[int]:
+    """
+    Peel cells holding symbol from a grid until no cell is removable.
+
+    Same round semantics as peel(), specialized to flat indices: initial
+    counts come from CompactGrid.neighbor_counts and removed cells are
+    overwritten with replacement in place.
+
+    Args:
+        grid: Grid to peel, modified in place
+        symbol: Value of the cells taking part in the peeling
+        removable: Test applied to a cell's count of symbol neighbors (0-8)
+        diagonal: Use the 8-neighborhood instead of the 4-neighborhood
+        replacement: Value written to removed cells
+
+    Returns:
+        PeelResult with removed flat indices and removals per round
+    """
+    counts, mask = grid.neighbor_mask(symbol, removable, diagonal, where=symbol)
+    cells = grid.cells
+    target = ord(symbol)
+    blank = ord(replacement)
+    removable_count = [removable(count) for count in range(9)]
+
+    frontier = []
+    index = mask.find(1)
+    while index != -1:
+        frontier.append(index)
+        index = mask.find(1, index + 1)
+    queued = mask
+    result: PeelResult[int] = PeelResult()
+
+    while frontier:
+        result.rounds.append(len(frontier))
+        result.removed.extend(frontier)
+        for index in frontier:
+            cells[index] = blank
+
+        touched = []
+        for index in frontier:
+            for neighbor in grid.neighbor_indices(index, diagonal):
+                counts[neighbor] -= 1
+                if cells[neighbor] == target and not queued[neighbor]:
+                    touched.append(neighbor)
+
+        next_frontier = []
+        for neighbor in touched:
+            if not queued[neighbor] and removable_count[counts[neighbor]]:
+                queued[neighbor] = 1
+                next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return result
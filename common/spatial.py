@@ -0,0 +1,359 @@
+"""Spatial indexes for 2D/3D point sets: KD-tree and uniform bucket grid."""
+
+from heapq import heappush, heappushpop
+from itertools import product
+from math import inf
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .pairs import Coordinates, _squared_distance_for
+
+Neighbor = Tuple[int, int]  # (squared distance, point index)
+
+
+class KDTree:
+    """
+    Static KD-tree over a list of points, built and searched without recursion.
+
+    The tree is implicit: build() reorders an index list so that every
+    range [lo, hi) holds a subtree whose splitting point sits at the middle
+    position, with the split axis (the widest one) stored alongside.
+    Ranges of at most leaf_size points are scanned directly.
+
+    Example:
+        tree = KDTree(points)
+        tree.knn(points[0], 3, skip=0)  # 3 nearest other points
+    """
+
+    def __init__(self, points: Sequence[Coordinates], leaf_size: int = 8):
+        self.points = points
+        self.leaf_size = max(1, leaf_size)
+        self.dimensions = len(points[0]) if len(points) else 0
+        self.distance = _squared_distance_for(self.dimensions)
+        self.order: List[int] = list(range(len(points)))
+        self.axes: Dict[int, int] = {}  # middle position -> split axis
+        self.ranges: List[Tuple[int, int]] = []  # every subtree, parents first
+        self._build()
+
+    def _build(self) -> None:
+        points, order = self.points, self.order
+        stack = [(0, len(order))]
+        while stack:
+            lo, hi = stack.pop()
+            if hi <= lo:
+                continue
+            self.ranges.append((lo, hi))
+            if hi - lo <= self.leaf_size:
+                continue
+            members = order[lo:hi]
+            axis = max(range(self.dimensions), key=lambda d: (
+                max(points[i][d] for i in members) - min(points[i][d] for i in members)))
+            members.sort(key=lambda i: points[i][axis])
+            order[lo:hi] = members
+            mid = (lo + hi) // 2
+            self.axes[mid] = axis
+            stack.append((lo, mid))
+            stack.append((mid + 1, hi))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def knn(self, query: Coordinates, k: int, skip: Optional[int] = None) -> List[Neighbor]:
+        """
+        The k points nearest to query.
+
+        Args:
+            query: Coordinates to search around
+            k: Number of neighbors
+            skip: Optional point index to leave out, e.g. the query's own
+
+        Returns:
+            (squared distance, index) pairs, nearest first, ties broken by
+            the smaller index
+        """
+        points, order, axes, leaf_size = self.points, self.order, self.axes, self.leaf_size
+        squared_distance = self.distance
+        best: List[Tuple[int, int]] = []  # max-heap of (-distance, -index)
+        if k <= 0:
+            return []
+
+        def consider(index: int) -> None:
+            if index == skip:
+                return
+            distance = squared_distance(query, points[index])
+            if len(best) < k:
+                heappush(best, (-distance, -index))
+            elif (-distance, -index) > best[0]:
+                heappushpop(best, (-distance, -index))
+
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, bound = stack.pop()
+            if len(best) == k and bound > -best[0][0]:
+                continue
+            if hi - lo <= leaf_size:
+                for position in range(lo, hi):
+                    consider(order[position])
+                continue
+            mid = (lo + hi) // 2
+            consider(order[mid])
+            axis = axes[mid]
+            diff = query[axis] - points[order[mid]][axis]
+            if diff < 0:
+                stack.append((mid + 1, hi, diff * diff))
+                stack.append((lo, mid, bound))
+            else:
+                stack.append((lo, mid, diff * diff))
+                stack.append((mid + 1, hi, bound))
+
+        return sorted((-distance, -index) for distance, index in best)
+
+    def nearest(self, query: Coordinates, skip: Optional[int] = None) -> Optional[Neighbor]:
+        """The nearest point to query as (squared distance, index), or None if empty."""
+        found = self.knn(query, 1, skip)
+        return found[0] if found else None
+
+    def radius(self, query: Coordinates, radius: float) -> List[Neighbor]:
+        """
+        Every point within radius of query (inclusive).
+
+        Returns:
+            (squared distance, index) pairs, nearest first
+        """
+        points, order, axes, leaf_size = self.points, self.order, self.axes, self.leaf_size
+        squared_distance = self.distance
+        limit = radius * radius
+        found = []
+        stack = [(0, len(order))]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= leaf_size:
+                for position in range(lo, hi):
+                    distance = squared_distance(query, points[order[position]])
+                    if distance <= limit:
+                        found.append((distance, order[position]))
+                continue
+            mid = (lo + hi) // 2
+            index = order[mid]
+            distance = squared_distance(query, points[index])
+            if distance <= limit:
+                found.append((distance, index))
+            diff = query[axes[mid]] - points[index][axes[mid]]
+            if diff <= radius:
+                stack.append((lo, mid))
+            if diff >= -radius:
+                stack.append((mid + 1, hi))
+        found.sort()
+        return found
+
+    def uniform_labels(self, labels: Sequence[int]) -> Dict[int, int]:
+        """
+        Label shared by all points of each subtree, for nearest_outside().
+
+        Args:
+            labels: Label per point index, e.g. its union-find component
+
+        Returns:
+            Map from subtree key lo * (len(points) + 1) + hi to the common
+            label, or -1 when the subtree is mixed
+        """
+        order, span = self.order, len(self.order) + 1
+        uniform: Dict[int, int] = {}
+        for lo, hi in reversed(self.ranges):  # children before parents
+            if hi - lo <= self.leaf_size:
+                label = labels[order[lo]]
+                for position in range(lo + 1, hi):
+                    if labels[order[position]] != label:
+                        label = -1
+                        break
+            else:
+                mid = (lo + hi) // 2
+                label = labels[order[mid]]
+                for child_lo, child_hi in ((lo, mid), (mid + 1, hi)):
+                    if child_hi > child_lo and uniform[child_lo * span + child_hi] != label:
+                        label = -1
+            uniform[lo * span + hi] = label
+        return uniform
+
+    def nearest_outside(self, index: int, labels: Sequence[int], uniform: Dict[int, int],
+                        bound: float = inf) -> Optional[Neighbor]:
+        """
+        Nearest point whose label differs from the label of point index.
+
+        Subtrees whose points all share the query's label are skipped
+        whole, which is what makes Borůvka rounds on point sets fast.
+
+        Args:
+            index: Index of the query point
+            labels: Label per point index
+            uniform: Output of uniform_labels(labels)
+            bound: Only report points strictly closer than this squared distance
+
+        Returns:
+            (squared distance, index) of the nearest such point, or None
+        """
+        points, order, axes, leaf_size = self.points, self.order, self.axes, self.leaf_size
+        squared_distance = self.distance
+        span = len(order) + 1
+        query, own = points[index], labels[index]
+        best_distance, best_index = bound, -1
+
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, plane = stack.pop()
+            if plane >= best_distance or hi <= lo or uniform[lo * span + hi] == own:
+                continue
+            if hi - lo <= leaf_size:
+                for position in range(lo, hi):
+                    other = order[position]
+                    if labels[other] != own:
+                        distance = squared_distance(query, points[other])
+                        if distance < best_distance:
+                            best_distance, best_index = distance, other
+                continue
+            mid = (lo + hi) // 2
+            other = order[mid]
+            if labels[other] != own:
+                distance = squared_distance(query, points[other])
+                if distance < best_distance:
+                    best_distance, best_index = distance, other
+            diff = query[axes[mid]] - points[other][axes[mid]]
+            if diff < 0:
+                stack.append((mid + 1, hi, diff * diff))
+                stack.append((lo, mid, plane))
+            else:
+                stack.append((lo, mid, diff * diff))
+                stack.append((mid + 1, hi, plane))
+
+        return (best_distance, best_index) if best_index >= 0 else None
+
+
+class BucketGrid:
+    """
+    Uniform grid hashing points into cubic cells.
+
+    Works best when points are spread fairly evenly; queries only look at
+    the cells that can hold an answer. The default cell size aims at
+    about two points per cell over the bounding box.
+    """
+
+    def __init__(self, points: Sequence[Coordinates], cell_size: Optional[float] = None):
+        self.points = points
+        self.dimensions = len(points[0]) if len(points) else 0
+        self.distance = _squared_distance_for(self.dimensions)
+        if cell_size is None:
+            volume = 1
+            for d in range(self.dimensions):
+                volume *= max(max(p[d] for p in points) - min(p[d] for p in points), 1)
+            cell_size = max((2 * volume / max(len(points), 1)) ** (1 / max(self.dimensions, 1)), 1)
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, ...], List[int]] = {}
+        for index, point in enumerate(points):
+            self.cells.setdefault(self.cell_of(point), []).append(index)
+
+    def cell_of(self, point: Coordinates) -> Tuple[int, ...]:
+        return tuple(int(c // self.cell_size) for c in point)
+
+    def radius(self, query: Coordinates, radius: float) -> List[Neighbor]:
+        """
+        Every point within radius of query (inclusive).
+
+        Returns:
+            (squared distance, index) pairs, nearest first
+        """
+        limit = radius * radius
+        points, cells, squared_distance = self.points, self.cells, self.distance
+        low = self.cell_of([c - radius for c in query])
+        high = self.cell_of([c + radius for c in query])
+        box = 1
+        for a, b in zip(low, high):
+            box *= b - a + 1
+        if box > len(cells):
+            # Fewer occupied cells than cells in the box: filter those instead
+            keys = [key for key in cells if all(a <= c <= b for c, a, b in zip(key, low, high))]
+        else:
+            keys = product(*(range(a, b + 1) for a, b in zip(low, high)))
+        found = []
+        for key in keys:
+            for index in cells.get(key, ()):
+                distance = squared_distance(query, points[index])
+                if distance <= limit:
+                    found.append((distance, index))
+        found.sort()
+        return found
+
+    def knn(self, query: Coordinates, k: int, skip: Optional[int] = None) -> List[Neighbor]:
+        """
+        The k points nearest to query, searching rings of cells outwards.
+
+        Args:
+            query: Coordinates to search around
+            k: Number of neighbors
+            skip: Optional point index to leave out, e.g. the query's own
+
+        Returns:
+            (squared distance, index) pairs, nearest first
+        """
+        points, cells, size = self.points, self.cells, self.cell_size
+        squared_distance = self.distance
+        center = self.cell_of(query)
+        best: List[Tuple[int, int]] = []
+        if k <= 0:
+            return []
+
+        def visit(indices: List[int]) -> None:
+            for index in indices:
+                if index == skip:
+                    continue
+                distance = squared_distance(query, points[index])
+                if len(best) < k:
+                    heappush(best, (-distance, -index))
+                elif (-distance, -index) > best[0]:
+                    heappushpop(best, (-distance, -index))
+
+        ring = 0
+        while True:
+            if (2 * ring + 1) ** self.dimensions > len(cells):
+                # The ring outgrew the occupied cells: scan everything left
+                for key, indices in cells.items():
+                    if max(abs(c - o) for c, o in zip(key, center)) >= ring:
+                        visit(indices)
+                break
+            for offset in product(range(-ring, ring + 1), repeat=self.dimensions):
+                if max(map(abs, offset)) == ring:
+                    visit(cells.get(tuple(c + o for c, o in zip(center, offset)), ()))
+            # Points in later rings are at least ring * size away; one at
+            # exactly that distance could still win a tie on index
+            reach = ring * size
+            if len(best) == k and -best[0][0] < reach * reach:
+                break
+            ring += 1
+
+        return sorted((-distance, -index) for distance, index in best)
+
+
+def candidate_edges(points: Sequence[Coordinates], k: int = 10,
+                    tree: Optional[KDTree] = None) -> List[Tuple[int, int, int]]:
+    """
+    Edges from every point to its k nearest neighbors, for Euclidean MST.
+
+    The k-nearest-neighbor graph holds the MST edges in practice for
+    small k on evenly spread points, at O(N k) edges instead of N²/2.
+    It is not guaranteed to: far-apart clusters may only be joined by
+    longer edges, so check that Kruskal over the candidates connects
+    everything, and fall back to closest_pairs() or use mst.boruvka()
+    for an exact tree.
+
+    Args:
+        points: Points as coordinate tuples
+        k: Neighbors per point
+        tree: Optional prebuilt KDTree over points
+
+    Returns:
+        Deduplicated (squared distance, i, j) edges with i < j, shortest first
+    """
+    tree = tree or KDTree(points)
+    edges = set()
+    for i, point in enumerate(points):
+        for distance, j in tree.knn(point, k, skip=i):
+            edges.add((distance, i, j) if i < j else (distance, j, i))
+    return sorted(edges)
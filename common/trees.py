@@ -32,11 +32,16 @@ class BinaryTree:
         return self._find(self.root, value)
 
     def _find(self, node, value):
-        if node is None:
-            return None
-        if node.value == value:
-            return node
-        return self._find(node.left, value) or self._find(node.right, value)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if node.value == value:
+                return node
+            stack.append(node.right)
+            stack.append(node.left)
+        return None
 
     # -------------------------
     # Traversals
@@ -47,11 +52,14 @@ class BinaryTree:
         return res
 
     def _preorder(self, node, res):
-        if not node:
-            return
-        res.append(node.value)
-        self._preorder(node.left, res)
-        self._preorder(node.right, res)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            res.append(node.value)
+            stack.append(node.right)
+            stack.append(node.left)
 
     def inorder(self):
         res = []
@@ -59,11 +67,14 @@ class BinaryTree:
         return res
 
     def _inorder(self, node, res):
-        if not node:
-            return
-        self._inorder(node.left, res)
-        res.append(node.value)
-        self._inorder(node.right, res)
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            res.append(node.value)
+            node = node.right
 
     def postorder(self):
         res = []
@@ -71,11 +82,17 @@ class BinaryTree:
         return res
 
     def _postorder(self, node, res):
-        if not node:
-            return
-        self._postorder(node.left, res)
-        self._postorder(node.right, res)
-        res.append(node.value)
+        # Root → Right → Left, then reversed
+        values = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            values.append(node.value)
+            stack.append(node.left)
+            stack.append(node.right)
+        res.extend(reversed(values))
 
     def level_order(self):
         if not self.root:
@@ -100,19 +117,30 @@ class BinaryTree:
         return self._count_leaves(self.root)
 
     def _count_leaves(self, node):
-        if not node:
-            return 0
-        if not node.left and not node.right:
-            return 1
-        return self._count_leaves(node.left) + self._count_leaves(node.right)
+        leaves = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            if not node.left and not node.right:
+                leaves += 1
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+        return leaves
 
     def height(self):
         return self._height(self.root)
 
     def _height(self, node):
-        if not node:
-            return 0
-        return 1 + max(self._height(node.left), self._height(node.right))
+        height = 0
+        level = [node] if node else []
+        while level:
+            height += 1
+            level = [child for parent in level
+                     for child in (parent.left, parent.right) if child]
+        return height
 
     def is_balanced(self):
         """Returns True if the tree is height-balanced."""
@@ -121,10 +149,24 @@ class BinaryTree:
     def _check_balanced(self, node):
         if not node:
             return True, 0
-        left_bal, left_h = self._check_balanced(node.left)
-        right_bal, right_h = self._check_balanced(node.right)
-        balanced = left_bal and right_bal and abs(left_h, right_h) <= 1
-        return balanced, 1 + max(left_h, right_h)
+        # Post-order with an explicit stack; heights of finished subtrees
+        heights = {}
+        balanced = True
+        stack = [(node, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                left_h = heights.pop(node.left, 0)
+                right_h = heights.pop(node.right, 0)
+                balanced = balanced and abs(left_h - right_h) <= 1
+                heights[node] = 1 + max(left_h, right_h)
+                continue
+            stack.append((node, True))
+            if node.right:
+                stack.append((node.right, False))
+            if node.left:
+                stack.append((node.left, False))
+        return balanced, heights[node]
 
     def to_list(self):
         """Return tree as a list using level-order."""
@@ -183,13 +225,13 @@ class TernaryTree:
         if node is None:
             return
 
-        visit(node)
-        if node.left:
-            self.preorder(node.left, visit)
-        if node.middle:
-            self.preorder(node.middle, visit)
-        if node.right:
-            self.preorder(node.right, visit)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            visit(node)
+            for child in (node.right, node.middle, node.left):
+                if child:
+                    stack.append(child)
 
     def postorder(self, node=None, visit=lambda x: print(x.value)):
         """Left → Middle → Right → Root"""
@@ -198,13 +240,17 @@ class TernaryTree:
         if node is None:
             return
 
-        if node.left:
-            self.postorder(node.left, visit)
-        if node.middle:
-            self.postorder(node.middle, visit)
-        if node.right:
-            self.postorder(node.right, visit)
-        visit(node)
+        # Root → Right → Middle → Left, then reversed
+        order = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for child in (node.left, node.middle, node.right):
+                if child:
+                    stack.append(child)
+        for node in reversed(order):
+            visit(node)
 
     def inorder(self, node=None, visit=lambda x: print(x.value)):
         """
@@ -216,13 +262,19 @@ class TernaryTree:
         if node is None:
             return
 
-        if node.left:
-            self.inorder(node.left, visit)
-        visit(node)
-        if node.middle:
-            self.inorder(node.middle, visit)
-        if node.right:
-            self.inorder(node.right, visit)
+        stack = [(node, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                visit(node)
+                continue
+            if node.right:
+                stack.append((node.right, False))
+            if node.middle:
+                stack.append((node.middle, False))
+            stack.append((node, True))
+            if node.left:
+                stack.append((node.left, False))
 
     def level_order(self, visit=lambda x: print(x.value)):
         """Breadth-First (Level Order)"""
@@ -248,11 +300,13 @@ class TernaryTree:
         if node is None:
             return -1
 
-        return 1 + max(
-            self.height(node.left),
-            self.height(node.middle),
-            self.height(node.right)
-        )
+        height = -1
+        level = [node]
+        while level:
+            height += 1
+            level = [child for parent in level
+                     for child in (parent.left, parent.middle, parent.right) if child]
+        return height
 
     def search(self, value, node=None):
         """Depth-first search for a value."""
@@ -261,14 +315,14 @@ class TernaryTree:
         if node is None:
             return None
 
-        if node.value == value:
-            return node
-
-        for child in (node.left, node.middle, node.right):
-            if child:
-                found = self.search(value, child)
-                if found:
-                    return found
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.value == value:
+                return node
+            for child in (node.right, node.middle, node.left):
+                if child:
+                    stack.append(child)
 
         return None
 
@@ -288,13 +342,19 @@ class TernaryTree:
 
     def pretty_print(self):
         """Print tree sideways."""
-        def _print(node, prefix="", is_left=True):
+        # Entries are (node, prefix, is_left, print_now); pushed in reverse
+        # of the order right subtree → node → left → middle
+        stack = [(self.root, "", True, False)]
+        while stack:
+            node, prefix, is_left, print_now = stack.pop()
             if node is None:
-                return
-
-            _print(node.right, prefix + ("│   " if is_left else "    "), False)
-            print(prefix + ("└── " if is_left else "┌── ") + str(node.value))
-            _print(node.left, prefix + ("    " if is_left else "│   "), True)
-            _print(node.middle, prefix + ("    " if is_left else "│   "), True)
-
-        _print(self.root)
+                continue
+            if print_now:
+                print(prefix + ("└── " if is_left else "┌── ") + str(node.value))
+                continue
+
+            below = prefix + ("    " if is_left else "│   ")
+            stack.append((node.middle, below, True, False))
+            stack.append((node.left, below, True, False))
+            stack.append((node, prefix, is_left, True))
+            stack.append((node.right, prefix + ("│   " if is_left else "    "), False, False))
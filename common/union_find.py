@@ -1,32 +1,203 @@
-class UnionFind:
-    def __init__(self, items):
+from array import array
+from bisect import bisect_left, insort
+from heapq import nlargest
+from typing import Dict, Hashable, Iterable, List, Optional
+
+
+class _ComponentStats:
+    """
+    Component statistics kept up to date on every union.
+
+    components and largest are always maintained. With track_sizes, a
+    histogram of component sizes plus the sorted list of distinct sizes
+    is kept as well, so top_sizes(k) walks only the k largest components
+    instead of finding every root. Sizes add up to the number of elements,
+    so there are few distinct sizes and the bisect updates stay cheap.
+    """
+
+    def _init_stats(self, count: int, track_sizes: bool) -> None:
+        self.components = count
+        self.largest = 1 if count else 0
+        self.size_counts: Optional[Dict[int, int]] = None
+        self._distinct_sizes: List[int] = []
+        if track_sizes:
+            self.size_counts = {}
+            if count:
+                self.size_counts[1] = count
+                self._distinct_sizes.append(1)
+
+    def _count_size(self, size: int, delta: int) -> None:
+        counts = self.size_counts
+        new_count = counts.get(size, 0) + delta
+        if new_count:
+            if size not in counts:
+                insort(self._distinct_sizes, size)
+            counts[size] = new_count
+        else:
+            del counts[size]
+            del self._distinct_sizes[bisect_left(self._distinct_sizes, size)]
+
+    def _on_add(self) -> None:
+        self.components += 1
+        if not self.largest:
+            self.largest = 1
+        if self.size_counts is not None:
+            self._count_size(1, 1)
+
+    def _on_union(self, size_x: int, size_y: int) -> None:
+        merged = size_x + size_y
+        self.components -= 1
+        if merged > self.largest:
+            self.largest = merged
+        if self.size_counts is not None:
+            self._count_size(size_x, -1)
+            self._count_size(size_y, -1)
+            self._count_size(merged, 1)
+
+    def is_connected(self) -> bool:
+        """True once every element is in a single component."""
+        return self.components <= 1
+
+    def top_sizes(self, k: int) -> List[int]:
+        """
+        Sizes of the k largest components, largest first.
+
+        O(k) with track_sizes; otherwise falls back to scanning every
+        component.
+        """
+        if self.size_counts is None:
+            return nlargest(k, self.get_component_sizes())
+        sizes = []
+        distinct = self._distinct_sizes
+        index = len(distinct) - 1
+        while len(sizes) < k and index >= 0:
+            size = distinct[index]
+            sizes.extend([size] * min(self.size_counts[size], k - len(sizes)))
+            index -= 1
+        return sizes
+
+
+class UnionFind(_ComponentStats):
+    def __init__(self, items, track_sizes=False):
         self.parent = {item: item for item in items}  # Each item is its own parent
-        self.size = {item: 1 for item in items}       # Each starts with size 1
-    
+        self.size = {item: 1 for item in self.parent}  # Each starts with size 1
+        self._init_stats(len(self.parent), track_sizes)
+
     def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # Path compression
-        return self.parent[x]
-    
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while x != root:  # Path compression
+            self.parent[x], x = root, self.parent[x]
+        return root
+
     def union(self, x, y):
         root_x = self.find(x)
         root_y = self.find(y)
-        
+
         if root_x == root_y:
             return False  # Already connected
-        
+
         # Merge smaller into larger
         if self.size[root_x] < self.size[root_y]:
             root_x, root_y = root_y, root_x
-        
+
+        self._on_union(self.size[root_x], self.size[root_y])
         self.parent[root_y] = root_x
         self.size[root_x] += self.size[root_y]
         return True
-    
+
     def get_component_sizes(self):
         roots = {}
         for item in self.parent:
             root = self.find(item)
             if root not in roots:
                 roots[root] = self.size[root]
-        return list(roots.values())
\ No newline at end of file
+        return list(roots.values())
+
+
+class DenseUnionFind(_ComponentStats):
+    """
+    Union-find over integer ids 0..n-1 backed by array('i') buffers.
+
+    Parents and sizes take 4 bytes per element each instead of two dict
+    entries, and find() never recurses. Arbitrary keys can be mapped to
+    ids with id(), which assigns the next free id to unseen keys.
+    Component statistics are the same as for UnionFind.
+
+    Example:
+        uf = DenseUnionFind(keys=boxes)
+        uf.union(uf.id(a), uf.id(b))
+    """
+
+    def __init__(self, n: int = 0, keys: Optional[Iterable[Hashable]] = None,
+                 track_sizes: bool = False):
+        """
+        Args:
+            n: Number of integer ids to start with
+            keys: Optional keys to map to ids n, n+1, ... (enables id())
+            track_sizes: Keep a size histogram for O(k) top_sizes()
+        """
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self._init_stats(n, track_sizes)
+        self.ids: Optional[Dict[Hashable, int]] = None
+        if keys is not None:
+            self.ids = {}
+            for key in keys:
+                self.id(key)
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        """Add a singleton set and return its id."""
+        new_id = len(self.parent)
+        self.parent.append(new_id)
+        self.size.append(1)
+        self._on_add()
+        return new_id
+
+    def id(self, key: Hashable) -> int:
+        """Id of key, adding it as a singleton if it is new."""
+        if self.ids is None:
+            self.ids = {}
+        found = self.ids.get(key)
+        if found is None:
+            found = self.ids[key] = self.add()
+        return found
+
+    def find(self, x: int) -> int:
+        """Root of x's set, compressing the path in a second pass."""
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while x != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets of x and y, smaller into larger; False if already joined."""
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        size = self.size
+        if size[root_x] < size[root_y]:
+            root_x, root_y = root_y, root_x
+        self._on_union(size[root_x], size[root_y])
+        self.parent[root_y] = root_x
+        size[root_x] += size[root_y]
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def get_component_sizes(self) -> List[int]:
+        size = self.size
+        return [size[x] for x, root in enumerate(self.parent) if x == root]
@@ -0,0 +1,7 @@
+"""Make the common package importable when running pytest from anywhere."""
+
+from pathlib import Path
+import sys
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
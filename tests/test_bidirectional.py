@@ -0,0 +1,46 @@
+"""Tests for bidirectional searches against their one-sided counterparts."""
+
+from random import Random
+
+from common import bfs, bidirectional_bfs, bidirectional_dijkstra, dijkstra
+
+
+def random_digraph(rng, n, m, max_weight):
+    forward = {node: [] for node in range(n)}
+    backward = {node: [] for node in range(n)}
+    for _ in range(m):
+        a, b, w = rng.randrange(n), rng.randrange(n), rng.randint(1, max_weight)
+        forward[a].append((b, w))
+        backward[b].append((a, w))
+    return forward, backward
+
+
+def path_cost(graph, path):
+    return sum(min(w for n, w in graph[a] if n == b) for a, b in zip(path, path[1:]))
+
+
+def test_bidirectional_dijkstra_matches_dijkstra():
+    rng = Random(11)
+    for _ in range(30):
+        forward, backward = random_digraph(rng, 40, 90, 9)
+        start, goal = rng.randrange(40), rng.randrange(40)
+        expected = dijkstra(start, lambda node: forward[node]).get(goal, float('inf'))
+        path, cost = bidirectional_dijkstra(start, goal, lambda node: forward[node],
+                                            lambda node: backward[node])
+        assert cost == expected
+        if path is not None:
+            assert path[0] == start and path[-1] == goal
+            assert path_cost(forward, path) == cost
+
+
+def test_bidirectional_bfs_matches_bfs():
+    rng = Random(12)
+    for _ in range(30):
+        forward, backward = random_digraph(rng, 40, 70, 1)
+        start, goal = rng.randrange(40), rng.randrange(40)
+        expected = bfs(start, lambda node: [n for n, _ in forward[node]]).get(goal, float('inf'))
+        path, length = bidirectional_bfs(start, goal, lambda node: [n for n, _ in forward[node]],
+                                         lambda node: [n for n, _ in backward[node]])
+        assert length == expected
+        if path is not None:
+            assert len(path) == length + 1
@@ -0,0 +1,47 @@
+"""Tests for BitGrid against CompactGrid cell by cell."""
+
+from random import Random
+
+import pytest
+
+from common import BitGrid, CompactGrid, Point
+
+
+def random_rows(rng, width, height):
+    return [''.join('#' if rng.random() < 0.45 else '.' for _ in range(width)) for _ in range(height)]
+
+
+def test_from_rows_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        BitGrid.from_rows(['#####', '#'])
+
+
+def test_neighbor_count_mask_matches_neighbor_counts():
+    rng = Random(7)
+    for diagonal in (False, True):
+        for width, height in ((1, 1), (7, 5), (40, 9)):
+            compact = CompactGrid.from_rows(random_rows(rng, width, height))
+            counts = compact.neighbor_counts('#', diagonal)
+            selected = BitGrid.from_grid(compact).neighbor_count_mask(lambda n: n in (2, 3), diagonal)
+            assert [selected.get(Point(i % width, i // width)) for i in range(width * height)] \
+                == [count in (2, 3) for count in counts]
+
+
+def test_shifted_moves_every_cell():
+    rng = Random(8)
+    rows = random_rows(rng, 9, 6)
+    bits = BitGrid.from_rows(rows)
+    for dx, dy in ((2, 1), (-3, 0), (0, -2), (-1, 4), (12, 0)):
+        moved = bits.shifted(dx, dy)
+        for y in range(6):
+            for x in range(9):
+                assert moved.get(Point(x, y)) == bits.get(Point(x - dx, y - dy))
+
+
+def test_compact_round_trip():
+    rng = Random(9)
+    compact = CompactGrid.from_rows(random_rows(rng, 13, 4))
+    bits = BitGrid.from_grid(compact)
+    assert str(bits.to_compact()) == str(compact)
+    assert bits.count() == len(compact.find_all('#'))
+    assert (~bits).count() == 13 * 4 - bits.count()
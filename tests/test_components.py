@@ -0,0 +1,39 @@
+"""Tests for run-based component labelling against a per-seed BFS."""
+
+from random import Random
+
+from common import CompactGrid, Point, bfs
+
+
+def bfs_components(grid, diagonal):
+    """Components as a set of frozensets of points, one BFS per unseen seed."""
+    seen = set()
+    components = set()
+    for point in grid.find_all('#'):
+        if point in seen:
+            continue
+        region = bfs(point, lambda p: [n for n in grid.neighbors(p, diagonal) if grid.get(n) == '#'])
+        seen.update(region)
+        components.add(frozenset(region))
+    return components
+
+
+def test_label_components_matches_bfs():
+    rng = Random(9)
+    for diagonal in (False, True):
+        for _ in range(10):
+            rows = [''.join('#' if rng.random() < 0.5 else '.' for _ in range(20)) for _ in range(15)]
+            grid = CompactGrid.from_rows(rows)
+            components = grid.label_components(lambda cell: cell == '#', diagonal)
+            labelled = {frozenset(components.points(label)) for label in range(1, components.count + 1)}
+            assert labelled == bfs_components(grid, diagonal)
+            assert sorted(components.sizes) == sorted(len(region) for region in labelled)
+
+
+def test_label_components_boxes_and_lookup():
+    grid = CompactGrid.from_rows(['##..', '#..#', '...#'])
+    components = grid.label_components(lambda cell: cell == '#')
+    label = components.label_at(Point(0, 0))
+    assert components.label_at(Point(2, 0)) == 0
+    assert components.boxes[label - 1] == (0, 0, 1, 1)
+    assert components.count == 2
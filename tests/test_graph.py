@@ -0,0 +1,26 @@
+"""Tests for the CSR Graph against the dict-based searches."""
+
+from random import Random
+
+from common import Graph, SearchStats, bfs, dijkstra
+
+
+def test_graph_dijkstra_keeps_large_weights_exact():
+    for big in (2 ** 31 + 5, 2 ** 40, 2 ** 70):
+        graph = Graph.from_edges([('a', 'b', big), ('b', 'c', big), ('a', 'c', 3 * big)])
+        assert graph.dijkstra('a') == {'a': 0, 'b': big, 'c': 2 * big}
+        assert graph.edges('a') == [('b', big), ('c', 3 * big)]
+
+
+def test_graph_searches_match_dict_searches():
+    rng = Random(18)
+    adjacency = {node: [] for node in range(50)}
+    for _ in range(150):
+        adjacency[rng.randrange(50)].append((rng.randrange(50), rng.randint(1, 9)))
+    graph = Graph.from_neighbors([0], lambda node: adjacency[node], weighted=True)
+    stats = SearchStats()
+    assert graph.dijkstra(0, stats=stats) == dijkstra(0, lambda node: adjacency[node])
+    assert stats.elapsed > 0
+
+    unweighted = Graph.from_neighbors([0], lambda node: [n for n, _ in adjacency[node]])
+    assert unweighted.bfs(0) == bfs(0, lambda node: [n for n, _ in adjacency[node]])
@@ -0,0 +1,58 @@
+"""Tests for the flat-index grid searches in common.algorithms."""
+
+from random import Random
+
+from common import CompactGrid, Point, SearchStats, a_star, bfs, grid_bfs
+from common.algorithms import jump_point_search
+
+
+def open_grid(size: int) -> CompactGrid:
+    return CompactGrid.from_rows(['.' * size] * size)
+
+
+def test_grid_bfs_records_elapsed_time():
+    stats = SearchStats()
+    grid_bfs(open_grid(50), Point(0, 0), lambda cell: cell != '#', stats=stats)
+    assert stats.expanded == 2500
+    assert stats.elapsed > 0
+
+
+def test_grid_bfs_matches_bfs():
+    grid = CompactGrid.from_rows(['..#..', '.#...', '...#.', '#....'])
+    start = Point(0, 0)
+
+    def neighbors(point):
+        return [n for n in grid.neighbors(point) if grid.get(n) != '#']
+
+    assert grid_bfs(grid, start, lambda cell: cell != '#').to_dict() == bfs(start, neighbors)
+
+
+def test_jump_point_search_matches_a_star_on_random_grids():
+    rng = Random(19)
+    for _ in range(20):
+        rows = [''.join('#' if rng.random() < 0.25 else '.' for _ in range(12)) for _ in range(12)]
+        grid = CompactGrid.from_rows(rows)
+        start, goal = Point(0, 0), Point(11, 11)
+        grid.set(start, '.')
+        grid.set(goal, '.')
+
+        def neighbors(point):
+            return [(n, 1) for n in grid.neighbors(point) if grid.get(n) != '#']
+
+        _, expected = a_star(start, goal, neighbors, Point.manhattan_distance)
+        _, actual = jump_point_search(grid, start, goal, lambda cell: cell != '#')
+        assert actual == expected
+
+
+def test_grid_bfs_accepts_plain_tuples():
+    grid = CompactGrid.from_rows(['...', '.#.', '...'])
+    passable = lambda cell: cell != '#'  # noqa: E731
+    expected = grid_bfs(grid, Point(0, 0), passable).to_dict()
+    assert grid_bfs(grid, (0, 0), passable).to_dict() == expected
+    assert grid_bfs(grid, [(0, 0), (2, 2)], passable)[Point(2, 0)] == 2
+    assert grid_bfs(grid, (0, 0), passable, goal=(2, 2))[Point(2, 2)] == 4
+
+
+def test_grid_bfs_ignores_goal_outside_grid():
+    distances = grid_bfs(open_grid(5), Point(0, 0), lambda cell: cell != '#', goal=Point(7, 0))
+    assert len(distances.to_dict()) == 25
@@ -0,0 +1,38 @@
+"""Tests for the priority queues in common.heaps against a min-scan reference."""
+
+from random import Random
+
+import pytest
+
+from common import BucketQueue, HeapQueue, IndexedHeap, RadixHeap
+
+
+@pytest.mark.parametrize('queue_class', [HeapQueue, BucketQueue, RadixHeap, IndexedHeap])
+def test_pops_match_min_scan(queue_class):
+    rng = Random(12)
+    queue, reference = queue_class(), []
+    last, item = 0, 0
+    for _ in range(2000):
+        if reference and rng.random() < 0.45:
+            expected = min(priority for priority, _ in reference)
+            priority, popped = queue.pop()
+            assert priority == expected
+            reference.remove((priority, popped))
+            last = priority
+        else:
+            # Monotone pushes, as Dijkstra makes, so every queue accepts them
+            entry = (last + rng.randint(0, 20), item)
+            queue.push(*entry)
+            reference.append(entry)
+            item += 1
+        assert len(queue) == len(reference)
+
+
+def test_indexed_heap_decrease_key():
+    queue = IndexedHeap()
+    for priority, item in ((5, 'a'), (3, 'b'), (8, 'c')):
+        queue.push(priority, item)
+    assert not queue.push_or_decrease(1, 'c')
+    assert queue.priority_of('c') == 1
+    assert [queue.pop() for _ in range(3)] == [(1, 'c'), (3, 'b'), (5, 'a')]
+    assert 'c' not in queue
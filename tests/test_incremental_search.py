@@ -0,0 +1,57 @@
+"""Tests for the generator searches and IncrementalSearch."""
+
+from random import Random
+
+from common import IncrementalSearch, bfs, dfs, dijkstra, iter_bfs, iter_dfs, iter_dijkstra
+
+
+def random_graph(seed, n=60, m=180):
+    rng = Random(seed)
+    graph = {node: [] for node in range(n)}
+    for _ in range(m):
+        graph[rng.randrange(n)].append((rng.randrange(n), rng.randint(1, 9)))
+    return graph
+
+
+def test_generators_match_eager_searches():
+    graph = random_graph(14)
+    unweighted = lambda node: [n for n, _ in graph[node]]  # noqa: E731
+    assert dict(iter_bfs(0, unweighted)) == bfs(0, unweighted)
+    assert {node for node, _ in iter_dfs(0, unweighted)} == dfs(0, unweighted)
+    settled = list(iter_dijkstra(0, graph.get))
+    assert dict(settled) == dijkstra(0, graph.get)
+    assert [distance for _, distance in settled] == sorted(distance for _, distance in settled)
+
+
+def test_interleaved_queries_match_dijkstra_without_restarting():
+    graph = random_graph(15)
+    expected = dijkstra(0, graph.get)
+    expansions = []
+
+    def neighbors(node):
+        expansions.append(node)
+        return graph[node]
+
+    search = IncrementalSearch(iter_dijkstra(0, neighbors))
+    rng = Random(16)
+    for _ in range(40):
+        goal = rng.randrange(80)  # ids >= 60 do not exist
+        assert search.distance_to(goal) == expected.get(goal, float('inf'))
+    assert search.distances_to([5, 70, 0]) == {
+        node: expected.get(node, float('inf')) for node in (5, 70, 0)}
+    node, distance = search.find(lambda node: node % 7 == 3)
+    assert distance == min(d for n, d in expected.items() if n % 7 == 3) == expected[node]
+    assert search.find(lambda node: node >= 60) is None
+
+    # Every node is expanded at most once across all the queries
+    assert len(expansions) == len(set(expansions))
+
+
+def test_iteration_resumes_where_queries_stopped():
+    graph = random_graph(17)
+    expected = list(iter_dijkstra(0, graph.get))
+    search = IncrementalSearch(iter_dijkstra(0, graph.get))
+    middle = expected[len(expected) // 2][0]
+    search.distance_to(middle)
+    assert list(search) == expected
+    assert search.exhausted and list(search) == expected
@@ -0,0 +1,76 @@
+"""Tests for bounded caches, memoize() and the explicit-stack solve()."""
+
+from random import Random
+
+import pytest
+
+from common import BoundedCache, StatePacker, memoize, solve
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now the oldest
+    cache.put('c', 3)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.get('b') is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 1, 1)
+
+
+def test_bounded_cache_weight_accounting():
+    cache = BoundedCache(maxweight=10, weigh=lambda key, value: value)
+    cache.put('a', 4)
+    cache.put('b', 5)
+    cache.put('a', 2)  # replacing an entry swaps its weight
+    assert cache.weight == 7 and len(cache) == 2
+    cache.put('c', 6)  # 13 > 10: evicts 'b', the least recently used
+    assert 'b' not in cache and cache.weight == 8
+    cache.put('d', 11)  # heavier than the budget on its own
+    assert len(cache) == 0 and cache.weight == 0
+    assert cache.stats.evictions == 4
+
+
+def test_memoize_counts_hits_and_misses():
+    calls = []
+
+    @memoize(maxsize=100)
+    def fib(n):
+        calls.append(n)
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(30) == 832040
+    assert len(calls) == 31
+    assert fib.cache.stats.misses == 31 and fib.cache.stats.hits == 28
+    assert fib(30) == 832040 and fib.cache.stats.hits == 29
+
+
+def test_solve_deep_chain_cycles_and_bounded_cache():
+    # A chain far deeper than the recursion limit
+    assert solve(0, lambda n: [n + 1] if n < 200_000 else [],
+                 lambda n, values: 1 + sum(values)) == 200_001
+
+    with pytest.raises(ValueError):
+        solve(0, lambda n: [(n + 1) % 5], lambda n, values: 0)
+
+    # Grid path counts, even when the cache can only hold a handful of states
+    def subproblems(state):
+        x, y = state
+        return [p for p in ((x - 1, y), (x, y - 1)) if min(p) >= 0]
+
+    def combine(state, values):
+        return sum(values) if values else 1
+
+    expected = solve((8, 8), subproblems, combine)
+    assert expected == 12870
+    assert solve((8, 8), subproblems, combine, cache=BoundedCache(maxsize=3)) == expected
+
+
+def test_state_packer_round_trip():
+    rng = Random(16)
+    packer = StatePacker([3, 8, 16])
+    for _ in range(100):
+        state = (rng.randrange(8), rng.randrange(256), rng.randrange(65536))
+        assert packer.unpack(packer.pack(state)) == state
+    with pytest.raises(ValueError):
+        packer.pack((8, 0, 0))
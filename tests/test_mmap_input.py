@@ -0,0 +1,54 @@
+"""Tests for the memory-mapped input readers."""
+
+import builtins
+
+import pytest
+
+from common import MappedInput, read_grid_mmap
+from common import file_utils
+
+
+def write(tmp_path, data: bytes):
+    path = tmp_path / 'input.txt'
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_read_grid_mmap_handles_crlf_and_trailing_blank_lines(tmp_path):
+    grid = read_grid_mmap(write(tmp_path, b'#.#\r\n...\r\n\r\n\n'))
+    assert (grid.width, grid.height) == (3, 2)
+    assert str(grid) == '#.#\n...'
+    with MappedInput(write(tmp_path, b'ab\r\ncd')) as mapped:
+        assert [bytes(line) for line in mapped.lines()] == [b'ab', b'cd']
+
+
+def test_read_grid_mmap_empty_file(tmp_path):
+    grid = read_grid_mmap(write(tmp_path, b''))
+    assert (grid.width, grid.height) == (0, 0)
+
+
+@pytest.mark.parametrize('data, message', [
+    (b'##\n\n##\n', 'row 1 is blank'),
+    (b'\n##\n', 'row 0 is blank'),
+    (b'##\n###\n', 'row 1 has length 3, expected 2'),
+])
+def test_read_grid_mmap_reports_bad_rows(tmp_path, data, message):
+    with pytest.raises(ValueError, match=message):
+        read_grid_mmap(write(tmp_path, data))
+
+
+def test_mapped_input_closes_file_when_mmap_fails(tmp_path, monkeypatch):
+    opened = []
+
+    def tracking_open(*args, **kwargs):
+        opened.append(builtins.open(*args, **kwargs))
+        return opened[-1]
+
+    def failing_mmap(*args, **kwargs):
+        raise OSError('no mapping')
+
+    monkeypatch.setattr(file_utils, 'open', tracking_open, raising=False)
+    monkeypatch.setattr(file_utils.mmap, 'mmap', failing_mmap)
+    with pytest.raises(OSError):
+        MappedInput(write(tmp_path, b'##\n'))
+    assert opened and opened[0].closed
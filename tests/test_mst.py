@@ -0,0 +1,27 @@
+"""Tests for Kruskal and Borůvka spanning trees."""
+
+from itertools import combinations
+from random import Random
+
+from common import boruvka, candidate_edges, closest_pairs, kruskal, squared_distance
+
+
+def test_boruvka_total_matches_kruskal():
+    rng = Random(25)
+    for dimensions in (2, 3):
+        for size in (2, 17, 200):
+            points = [tuple(rng.randint(0, 1000) for _ in range(dimensions)) for _ in range(size)]
+            expected = kruskal(size, closest_pairs(points))
+            actual = boruvka(points)
+            assert actual.connected and len(actual.edges) == size - 1
+            assert actual.total == expected.total
+            assert actual.last_edge[0] == expected.last_edge[0]
+
+
+def test_kruskal_limits_and_candidate_edges():
+    points = [(0, 0), (1, 0), (5, 0), (6, 0), (20, 0)]
+    edges = sorted((squared_distance(points[i], points[j]), i, j)
+                   for i, j in combinations(range(len(points)), 2))
+    partial = kruskal(len(points), edges, max_attempted=2, stop_when_connected=False)
+    assert partial.union_find.top_sizes(3) == [2, 2, 1]
+    assert kruskal(len(points), candidate_edges(points, k=2)).total == 1 + 16 + 1 + 196
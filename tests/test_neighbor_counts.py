@@ -0,0 +1,34 @@
+"""Tests for the packed neighbor counts against a per-cell count."""
+
+from random import Random
+
+import pytest
+
+from common import CompactGrid, Grid, Point
+
+
+def per_cell_counts(rows, diagonal):
+    height, width = len(rows), len(rows[0])
+    counts = []
+    for y in range(height):
+        for x in range(width):
+            counts.append(sum(1 for n in Point(x, y).neighbors(diagonal)
+                              if 0 <= n.x < width and 0 <= n.y < height and rows[n.y][n.x] == '@'))
+    return counts
+
+
+@pytest.mark.parametrize('diagonal', [False, True])
+def test_neighbor_counts_match_per_cell_count(diagonal):
+    rng = Random(2)
+    for width, height in ((1, 1), (1, 6), (6, 1), (13, 9)):
+        rows = [''.join(rng.choice('@.') for _ in range(width)) for _ in range(height)]
+        expected = per_cell_counts(rows, diagonal)
+        assert list(CompactGrid.from_rows(rows).neighbor_counts('@', diagonal)) == expected
+        assert list(Grid([list(row) for row in rows]).neighbor_counts('@', diagonal)) == expected
+
+
+def test_neighbor_mask_filters_by_predicate_and_cell():
+    rows = ['@@@', '@@.', '...']
+    counts, mask = Grid([list(row) for row in rows]).neighbor_mask('@', lambda n: n < 3, True, where='@')
+    assert list(counts) == per_cell_counts(rows, True)
+    assert list(mask) == [0, 0, 1, 0, 0, 0, 0, 0, 0]  # only (2, 0) has fewer than 3
@@ -0,0 +1,26 @@
+"""Tests for closest_pairs() against sorting every combination."""
+
+from itertools import combinations, islice
+from random import Random
+
+from common import closest_pairs, squared_distance
+
+
+def all_pairs(points):
+    return sorted((squared_distance(points[i], points[j]), i, j)
+                  for i, j in combinations(range(len(points)), 2))
+
+
+def test_closest_pairs_matches_sorted_combinations():
+    rng = Random(23)
+    for dimensions in (2, 3):
+        for batch in (1, 16, 1024):
+            points = [tuple(rng.randint(0, 50) for _ in range(dimensions)) for _ in range(60)]
+            assert list(closest_pairs(points, batch)) == all_pairs(points)
+
+
+def test_closest_pairs_prefix_and_degenerate_inputs():
+    points = [(0, 0), (10, 0), (0, 3), (10, 1)]
+    assert list(islice(closest_pairs(points), 2)) == [(1, 1, 3), (9, 0, 2)]
+    assert list(closest_pairs([(1, 1)])) == []
+    assert list(closest_pairs([(2, 2)] * 3)) == [(0, 0, 1), (0, 0, 2), (0, 1, 2)]
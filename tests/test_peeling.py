@@ -0,0 +1,47 @@
+"""Tests for common.peeling against a full rescan every round."""
+
+from random import Random
+
+from common import CompactGrid, peel, peel_grid
+
+
+def rescan(alive, neighbors_fn, removable):
+    alive = set(alive)
+    rounds = []
+    while True:
+        batch = {node for node in alive
+                 if removable(sum(1 for n in neighbors_fn(node) if n in alive))}
+        if not batch:
+            return alive, rounds
+        rounds.append(len(batch))
+        alive -= batch
+
+
+def random_rows(rng, size=15):
+    return [''.join('@' if rng.random() < 0.6 else '.' for _ in range(size)) for _ in range(size)]
+
+
+def test_peel_matches_rescan_for_non_monotone_predicate():
+    rng = Random(3)
+    removable = lambda count: count in (1, 3, 5)  # noqa: E731
+    for _ in range(10):
+        grid = CompactGrid.from_rows(random_rows(rng))
+        nodes = grid.find_all('@')
+        neighbors = lambda point: grid.neighbors(point, diagonal=True)  # noqa: E731
+        left, rounds = rescan(nodes, neighbors, removable)
+        result = peel(nodes, neighbors, removable)
+        assert set(nodes) - set(result.removed) == left
+        assert result.rounds == rounds
+
+
+def test_peel_grid_matches_peel():
+    rng = Random(4)
+    removable = lambda count: count < 4  # noqa: E731
+    for _ in range(10):
+        rows = random_rows(rng)
+        grid = CompactGrid.from_rows(rows)
+        nodes = grid.find_all('@')
+        expected = peel(nodes, lambda point: grid.neighbors(point, diagonal=True), removable)
+        actual = peel_grid(grid, '@', removable, diagonal=True)
+        assert actual.rounds == expected.rounds
+        assert actual.total == expected.total
@@ -0,0 +1,53 @@
+"""Tests for the SearchStats counters."""
+
+import json
+
+import pytest
+
+from common import CompactGrid, Graph, Point, SearchStats, a_star, bfs, dfs, dijkstra, grid_bfs
+from common import iter_bfs, iter_dfs, iter_dijkstra
+from common.algorithms import jump_point_search
+
+STAR = {0: [1, 2, 3, 4, 5], 1: [], 2: [], 3: [], 4: [], 5: []}
+
+
+def weighted(node):
+    return [(neighbor, 1) for neighbor in STAR[node]]
+
+
+@pytest.mark.parametrize('search', [
+    lambda stats: bfs(0, STAR.get, stats=stats),
+    lambda stats: dfs(0, STAR.get, stats=stats),
+    lambda stats: dijkstra(0, weighted, stats=stats),
+    lambda stats: a_star(0, 6, weighted, lambda node, goal: 0, stats=stats),
+    lambda stats: list(iter_bfs(0, STAR.get, stats=stats)),
+    lambda stats: list(iter_dfs(0, STAR.get, stats=stats)),
+    lambda stats: list(iter_dijkstra(0, weighted, stats=stats)),
+    lambda stats: Graph.from_neighbors([0], weighted, weighted=True).dijkstra(0, stats=stats),
+])
+def test_peak_frontier_includes_last_pushes(search):
+    stats = SearchStats()
+    search(stats)
+    assert stats.peak_frontier == 5
+    assert stats.pushes == 6
+    assert stats.expanded == 6
+
+
+def test_grid_searches_count_pushes_and_peak():
+    grid = CompactGrid.from_rows(['...', '...', '...'])
+    stats = SearchStats()
+    grid_bfs(grid, Point(1, 1), lambda cell: cell == '.', stats=stats)
+    assert (stats.pushes, stats.expanded, stats.peak_frontier) == (9, 9, 6)
+
+    stats = SearchStats()
+    jump_point_search(grid, Point(0, 0), Point(2, 2), lambda cell: cell == '.', stats=stats)
+    assert stats.peak_frontier >= 1 and stats.pushes >= stats.expanded
+
+
+def test_reset_and_to_json():
+    stats = SearchStats()
+    bfs(0, STAR.get, stats=stats)
+    assert json.loads(stats.to_json()) == stats.as_dict()
+    assert json.loads(stats.to_json())['pushes'] == 6
+    stats.reset()
+    assert stats.as_dict() == SearchStats().as_dict()
@@ -0,0 +1,36 @@
+"""Tests for predecessor tracking in bfs() and dijkstra()."""
+
+from math import comb
+from random import Random
+
+from common import CompactGrid, Point, bfs, dijkstra
+
+
+def test_bfs_counts_lattice_paths():
+    grid = CompactGrid.from_rows(['.' * 6] * 5)
+    distances = bfs(Point(0, 0), lambda p: list(grid.neighbors(p)), all_parents=True)
+    for point in (Point(5, 4), Point(3, 2), Point(0, 4)):
+        assert distances.count_shortest_paths(point) == comb(point.x + point.y, point.x)
+        assert len(distances.path_to(point)) == distances[point] + 1
+
+
+def test_dijkstra_paths_and_counts_match_relaxation():
+    rng = Random(13)
+    n = 30
+    graph = {node: [] for node in range(n)}
+    for _ in range(80):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            graph[a].append((b, rng.randint(1, 3)))
+    distances = dijkstra(0, lambda node: graph[node], all_parents=True)
+
+    # Reference path counts from the settled distances, in distance order
+    counts = {0: 1}
+    for node in sorted(distances, key=distances.get)[1:]:
+        counts[node] = sum(counts[a] for a in distances for b, w in graph[a]
+                           if b == node and distances[a] + w == distances[node])
+    for node in distances:
+        assert distances.count_shortest_paths(node) == counts[node]
+        path = distances.path_to(node)
+        cost = sum(min(w for b, w in graph[a] if b == c) for a, c in zip(path, path[1:]))
+        assert cost == distances[node]
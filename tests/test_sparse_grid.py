@@ -0,0 +1,38 @@
+"""Tests for SparseGrid cell access and bounding box upkeep."""
+
+from common import CompactGrid, Point, SparseGrid
+
+
+def test_get_matches_dense_grid():
+    dense = CompactGrid.from_rows(['..#', '#..', '.#.'])
+    sparse = SparseGrid.from_grid(dense)
+    for point in (Point(x, y) for y in range(3) for x in range(3)):
+        assert sparse.get(point) == dense.get(point)
+    assert sparse.get(Point(-5, 9)) == '.'
+    assert sparse.get(Point(-5, 9), '?') == '?'
+    assert len(sparse) == 3
+
+
+def test_set_and_discard():
+    sparse = SparseGrid()
+    sparse.set(Point(2, 3), '#')
+    assert Point(2, 3) in sparse and sparse.get(Point(2, 3)) == '#'
+    sparse.set(Point(2, 3), '.')  # background empties the cell
+    assert Point(2, 3) not in sparse and len(sparse) == 0
+    sparse.set(Point(1, 1), '#')
+    sparse.discard(Point(1, 1))
+    sparse.discard(Point(1, 1))
+    assert sparse.bounds is None and str(sparse) == ''
+
+
+def test_bounding_box_grows_and_shrinks():
+    sparse = SparseGrid()
+    for point in (Point(0, 0), Point(-3, 2), Point(4, -1), Point(1, 1)):
+        sparse.set(point, '#')
+    assert sparse.bounds == (-3, -1, 4, 2)
+    sparse.discard(Point(-3, 2))
+    assert sparse.bounds == (0, -1, 4, 1)
+    sparse.discard(Point(4, -1))
+    assert sparse.bounds == (0, 0, 1, 1)
+    assert (sparse.width, sparse.height) == (2, 2)
+    assert str(sparse) == '#.\n.#'
@@ -0,0 +1,36 @@
+"""Tests for KDTree and BucketGrid queries against a linear scan."""
+
+from random import Random
+
+import pytest
+
+from common import BucketGrid, KDTree, squared_distance
+
+
+def scan(points, query, skip=None):
+    return sorted((squared_distance(query, point), index)
+                  for index, point in enumerate(points) if index != skip)
+
+
+@pytest.mark.parametrize('index_class', [KDTree, BucketGrid])
+def test_knn_and_radius_match_linear_scan(index_class):
+    rng = Random(24)
+    for dimensions in (2, 3):
+        points = [tuple(rng.randint(0, 30) for _ in range(dimensions)) for _ in range(300)]
+        index = index_class(points)
+        for _ in range(30):
+            query = tuple(rng.randint(-5, 35) for _ in range(dimensions))
+            skip = rng.randrange(len(points))
+            assert index.knn(query, 7, skip=skip) == scan(points, query, skip)[:7]
+            radius = rng.randint(0, 8)
+            assert index.radius(query, radius) == [
+                entry for entry in scan(points, query) if entry[0] <= radius * radius]
+
+
+def test_knn_with_clustered_points():
+    # Two far-apart clusters push BucketGrid onto its occupied-cell fallback
+    points = [(x, y) for x in range(5) for y in range(5)] + [(10 ** 6 + x, 0) for x in range(5)]
+    for index_class in (KDTree, BucketGrid):
+        index = index_class(points)
+        assert index.knn((10 ** 6, 0), 6) == scan(points, (10 ** 6, 0))[:6]
+        assert index.knn((0, 0), 1, skip=0) == [(1, 1)]
@@ -0,0 +1,35 @@
+"""Tests for the lazy line, record and section readers."""
+
+import io
+import sys
+
+from common import iter_lines, iter_parsed, iter_sections
+
+TEXT = "  1,2 \n3,4\n\n5,6\n\n\n7,8\n"
+
+
+def test_iter_lines_strips_and_streams():
+    assert list(iter_lines(io.StringIO(TEXT))) == ['1,2', '3,4', '', '5,6', '', '', '7,8']
+    assert next(iter_lines(io.StringIO(TEXT), strip=False)) == '  1,2 \n'
+    source = io.StringIO(TEXT)
+    lines = iter_lines(source)
+    next(lines)
+    assert source.readline() == '3,4\n'  # only one line was consumed
+
+
+def test_iter_parsed_skips_blank_lines():
+    parsed = iter_parsed(io.StringIO(TEXT), lambda line: tuple(map(int, line.split(','))))
+    assert list(parsed) == [(1, 2), (3, 4), (5, 6), (7, 8)]
+
+
+def test_iter_sections_groups_lines():
+    assert list(iter_sections(io.StringIO(TEXT))) == [['1,2', '3,4'], ['5,6'], ['7,8']]
+    assert list(iter_sections(io.StringIO('\n\n'))) == []
+
+
+def test_readers_accept_paths_and_stdin(tmp_path, monkeypatch):
+    path = tmp_path / 'input.txt'
+    path.write_text(TEXT)
+    assert list(iter_sections(str(path))) == [['1,2', '3,4'], ['5,6'], ['7,8']]
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(TEXT))
+    assert list(iter_parsed('-', len)) == [3, 3, 3, 3]
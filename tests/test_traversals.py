@@ -0,0 +1,95 @@
+"""Tests for the recursion-free DFS helpers against brute force."""
+
+from random import Random
+
+import pytest
+
+from common import dfs_visit, find_cycle, strongly_connected_components, topological_sort
+
+
+def random_digraph(rng, n, m, acyclic=False):
+    graph = {node: [] for node in range(n)}
+    for _ in range(m):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if acyclic:
+            a, b = min(a, b), max(a, b)
+            if a == b:
+                continue
+        graph[a].append(b)
+    return graph
+
+
+def reachable(graph, start):
+    seen, stack = {start}, [start]
+    while stack:
+        for neighbor in graph[stack.pop()]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def test_scc_matches_mutual_reachability():
+    rng = Random(17)
+    for _ in range(20):
+        graph = random_digraph(rng, 25, 40)
+        reach = {node: reachable(graph, node) for node in graph}
+        components = strongly_connected_components(graph, graph.get)
+        assert sorted(node for component in components for node in component) == list(graph)
+        for component in components:
+            expected = {other for other in graph if other in reach[component[0]] and component[0] in reach[other]}
+            assert set(component) == expected
+        # Reverse topological order: edges only point to earlier components
+        position = {node: i for i, component in enumerate(components) for node in component}
+        assert all(position[b] <= position[a] for a in graph for b in graph[a])
+
+
+def test_find_cycle_and_topological_sort_agree():
+    rng = Random(18)
+    for acyclic in (False, True) * 15:
+        graph = random_digraph(rng, 20, 25, acyclic)
+        cycle = find_cycle(graph, graph.get)
+        if cycle is None:
+            order = topological_sort(graph, graph.get)
+            position = {node: i for i, node in enumerate(order)}
+            assert sorted(order) == list(graph)
+            assert all(position[a] < position[b] for a in graph for b in graph[a])
+        else:
+            assert not acyclic
+            assert cycle[0] == cycle[-1]
+            assert all(b in graph[a] for a, b in zip(cycle, cycle[1:]))
+            with pytest.raises(ValueError):
+                topological_sort(graph, graph.get)
+
+
+def test_dfs_visit_matches_recursive_order():
+    rng = Random(19)
+    graph = random_digraph(rng, 30, 60)
+    expected, seen = [], set()
+
+    def recurse(node, parent):
+        seen.add(node)
+        expected.append(('enter', node, parent))
+        for neighbor in graph[node]:
+            if neighbor not in seen:
+                recurse(neighbor, node)
+        expected.append(('exit', node, parent))
+
+    for root in graph:
+        if root not in seen:
+            recurse(root, None)
+
+    events = []
+    dfs_visit(graph, graph.get,
+              on_enter=lambda node, parent: events.append(('enter', node, parent)),
+              on_exit=lambda node, parent: events.append(('exit', node, parent)))
+    assert events == expected
+
+
+def test_million_node_chain_has_no_recursion_limit():
+    n = 1_000_000
+    chain = lambda node: [node + 1] if node + 1 < n else []  # noqa: E731
+    assert len(dfs_visit([0], chain)) == n
+    assert len(strongly_connected_components([0], chain)) == n
+    assert find_cycle([0], chain) is None
+    assert topological_sort([0], chain)[-1] == n - 1
@@ -0,0 +1,111 @@
+"""Tests for the stack-based tree traversals against recursive references."""
+
+import sys
+from random import Random
+
+from common import TernaryNode, TernaryTree
+from common.trees import BinaryTree
+
+
+def random_binary_tree(rng, size):
+    tree = BinaryTree(0)
+    nodes = [tree.root]
+    for value in range(1, size):
+        parent = rng.choice(nodes)
+        side = rng.choice(('left', 'right'))
+        if getattr(parent, side) is None:
+            nodes.append((tree.insert_left if side == 'left' else tree.insert_right)(parent, value))
+    return tree
+
+
+def random_ternary_tree(rng, size):
+    root = TernaryNode(0)
+    nodes = [root]
+    for value in range(1, size):
+        parent = rng.choice(nodes)
+        side = rng.choice(('left', 'middle', 'right'))
+        if getattr(parent, side) is None:
+            child = TernaryNode(value)
+            setattr(parent, side, child)
+            nodes.append(child)
+    return TernaryTree(root)
+
+
+def binary_orders(node):
+    """(preorder, inorder, postorder, height, balanced) computed recursively."""
+    if node is None:
+        return [], [], [], 0, True
+    left, right = binary_orders(node.left), binary_orders(node.right)
+    balanced = left[4] and right[4] and abs(left[3] - right[3]) <= 1
+    return ([node.value] + left[0] + right[0], left[1] + [node.value] + right[1],
+            left[2] + right[2] + [node.value], 1 + max(left[3], right[3]), balanced)
+
+
+def ternary_orders(node):
+    """(preorder, inorder, postorder, height) computed recursively."""
+    if node is None:
+        return [], [], [], -1
+    children = [ternary_orders(child) for child in (node.left, node.middle, node.right)]
+    left, middle, right = children
+    return ([node.value] + left[0] + middle[0] + right[0],
+            left[1] + [node.value] + middle[1] + right[1],
+            left[2] + middle[2] + right[2] + [node.value],
+            1 + max(child[3] for child in children))
+
+
+def ternary_pretty(node, prefix='', is_left=True):
+    if node is None:
+        return []
+    return (ternary_pretty(node.right, prefix + ('│   ' if is_left else '    '), False)
+            + [prefix + ('└── ' if is_left else '┌── ') + str(node.value)]
+            + ternary_pretty(node.left, prefix + ('    ' if is_left else '│   '), True)
+            + ternary_pretty(node.middle, prefix + ('    ' if is_left else '│   '), True))
+
+
+def test_binary_tree_matches_recursive_traversals():
+    rng = Random(17)
+    for size in (1, 2, 5, 40):
+        tree = random_binary_tree(rng, size)
+        preorder, inorder, postorder, height, balanced = binary_orders(tree.root)
+        assert (tree.preorder(), tree.inorder(), tree.postorder()) == (preorder, inorder, postorder)
+        assert tree.height() == height
+        assert tree.is_balanced() == balanced
+        assert tree.find(preorder[-1]).value == preorder[-1] and tree.find(-1) is None
+
+
+def test_binary_tree_is_balanced_regression():
+    tree = BinaryTree(1)
+    tree.insert_left(tree.root, 2)
+    assert tree.is_balanced()  # used to call abs() with two arguments
+    tree.insert_left(tree.root.left, 3)
+    assert not tree.is_balanced()
+
+
+def test_ternary_tree_matches_recursive_traversals(capsys):
+    rng = Random(18)
+    for size in (1, 3, 40):
+        tree = random_ternary_tree(rng, size)
+        preorder, inorder, postorder, height = ternary_orders(tree.root)
+        for method, expected in ((tree.preorder, preorder), (tree.inorder, inorder),
+                                 (tree.postorder, postorder)):
+            visited = []
+            method(visit=lambda node: visited.append(node.value))
+            assert visited == expected
+        assert tree.height() == height  # used to recurse forever
+        tree.pretty_print()
+        assert capsys.readouterr().out.splitlines() == ternary_pretty(tree.root)
+
+
+def test_deep_trees_do_not_hit_the_recursion_limit():
+    depth = sys.getrecursionlimit() * 10
+    binary = BinaryTree(0)
+    node = binary.root
+    for value in range(1, depth):
+        node = binary.insert_left(node, value)
+    assert binary.height() == depth and len(binary.postorder()) == depth
+
+    root = node = TernaryNode(0)
+    for value in range(1, depth):
+        node.middle = TernaryNode(value)
+        node = node.middle
+    assert TernaryTree(root).height() == depth - 1
@@ -0,0 +1,30 @@
+"""Tests for DenseUnionFind and the incremental component statistics."""
+
+from heapq import nlargest
+from random import Random
+
+from common import DenseUnionFind, UnionFind
+
+
+def test_dense_top_sizes_match_union_find_sizes():
+    rng = Random(22)
+    n = 200
+    dense = DenseUnionFind(n, track_sizes=True)
+    reference = UnionFind(range(n))
+    for _ in range(150):
+        a, b = rng.randrange(n), rng.randrange(n)
+        assert dense.union(a, b) == reference.union(a, b)
+        sizes = reference.get_component_sizes()
+        assert dense.top_sizes(5) == nlargest(5, sizes)
+        assert dense.components == len(sizes)
+        assert dense.largest == max(sizes)
+
+
+def test_dense_union_find_keys_and_connectivity():
+    dense = DenseUnionFind(keys='abc')
+    dense.union(dense.id('a'), dense.id('b'))
+    assert dense.connected(dense.id('a'), dense.id('b'))
+    assert not dense.is_connected()
+    dense.union(dense.id('c'), dense.id('d'))  # 'd' is added on first use
+    dense.union(dense.id('b'), dense.id('d'))
+    assert dense.is_connected() and dense.component_size(0) == 4